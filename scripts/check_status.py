@@ -1,11 +1,52 @@
 #!/usr/bin/env python
 """Check status of MCP trading system"""
 
-import subprocess
-import pandas as pd
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import psutil
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 
+
+def read_parquet_freshness(file):
+    """Return (row_count, last_time) for a parquet file using only its footer metadata"""
+    # pre_buffer=False: only the footer is fetched unless a row group lacks statistics
+    pf = pq.ParquetFile(file, pre_buffer=False)
+    meta = pf.metadata
+    if meta.num_rows == 0:
+        return 0, None
+
+    time_idx = pf.schema_arrow.get_field_index("time")
+    row_group_maxes = []
+    for rg in range(meta.num_row_groups):
+        stats = meta.row_group(rg).column(time_idx).statistics
+        if stats is not None and stats.has_min_max:
+            row_group_maxes.append(stats.max)
+        else:
+            # No statistics for this row group - decode just its time column
+            row_group_maxes.append(pc.max(pf.read_row_group(rg, columns=["time"]).column("time")).as_py())
+
+    # Bar times are stored in UTC; statistics may come back naive
+    last_time = max(
+        (t if t.tzinfo else t.replace(tzinfo=timezone.utc) for t in row_group_maxes if t is not None),
+        default=None
+    )
+    return meta.num_rows, last_time
+
+
+def find_server_pids(names):
+    """Map each server script name to the PID of a running process, or None"""
+    pids = dict.fromkeys(names)
+    for proc in psutil.process_iter(["pid", "cmdline"]):
+        cmdline = " ".join(proc.info["cmdline"] or ())
+        for name in names:
+            if pids[name] is None and name in cmdline:
+                pids[name] = proc.info["pid"]
+    return pids
+
+
 print("=" * 60)
 print("MCP TRADING SYSTEM STATUS")
 print("=" * 60)
@@ -14,21 +55,22 @@ print("=" * 60)
 print("\n📡 SERVER STATUS:")
 print("-" * 40)
 
+# Single pass over the process table for both servers
+server_pids = find_server_pids(["ta_server_full", "mcp_server_integrated"])
+
 # Check data collection server
-result = subprocess.run("ps aux | grep ta_server_full | grep -v grep", shell=True, capture_output=True, text=True)
-if result.stdout:
+pid = server_pids["ta_server_full"]
+if pid is not None:
     print("✅ Data Collection Server: RUNNING")
-    pid = result.stdout.split()[1]
     print(f"   PID: {pid}")
 else:
     print("❌ Data Collection Server: NOT RUNNING")
     print("   Run: make run")
 
 # Check MCP server
-result = subprocess.run("ps aux | grep mcp_server_integrated | grep -v grep", shell=True, capture_output=True, text=True)
-if result.stdout:
+pid = server_pids["mcp_server_integrated"]
+if pid is not None:
     print("✅ MCP Server: RUNNING")
-    pid = result.stdout.split()[1]
     print(f"   PID: {pid}")
 else:
     print("⚠️  MCP Server: NOT RUNNING")
@@ -44,43 +86,65 @@ total_rows = 0
 fresh_symbols = []
 stale_symbols = []
 
-for asset_type in ["stocks", "crypto"]:
-    type_files = 0
-    type_rows = 0
-
-    for timeframe in ["1min", "5min", "15min", "1hour"]:
-        tf_dir = data_dir / asset_type / timeframe
-        if tf_dir.exists():
-            files = list(tf_dir.glob("*.parquet"))
-            type_files += len(files)
-
-            # Check 1min data freshness
-            if timeframe == "1min":
-                for file in files:
-                    try:
-                        df = pd.read_parquet(file)
-                        type_rows += len(df)
-
-                        if len(df) > 0:
-                            last_time = pd.to_datetime(df["time"].max())
-                            age = datetime.now(timezone.utc) - last_time
-                            symbol = file.stem.split("_")[0]
-
-                            if asset_type == "crypto":
-                                symbol = symbol.replace("_", "/")
-
-                            if age < timedelta(minutes=5):
-                                fresh_symbols.append(f"{symbol} ({asset_type[0].upper()})")
-                            elif age > timedelta(hours=1):
-                                stale_symbols.append(f"{symbol} ({asset_type[0].upper()}, {age.days}d)")
-                    except:
-                        pass
+asset_types = ["stocks", "crypto"]
+file_counts = {asset_type: 0 for asset_type in asset_types}
+row_counts = {asset_type: 0 for asset_type in asset_types}
+freshness_jobs = []
+
+timeframes = {"1min", "5min", "15min", "1hour"}
+
+# One recursive walk, then bucket files by their <asset_type>/<timeframe> path
+for file in data_dir.rglob("*.parquet"):
+    parts = file.relative_to(data_dir).parts
+    if len(parts) != 3 or parts[0] not in file_counts or parts[1] not in timeframes:
+        continue
+
+    asset_type, timeframe = parts[0], parts[1]
+    file_counts[asset_type] += 1
+
+    # Check 1min data freshness
+    if timeframe == "1min":
+        freshness_jobs.append((asset_type, file))
+
 
+def scan_freshness(job):
+    """Scan one parquet file, returning (asset_type, file, row_count, last_time)"""
+    asset_type, file = job
+    try:
+        num_rows, last_time = read_parquet_freshness(file)
+    except Exception:
+        return asset_type, file, 0, None
+    return asset_type, file, num_rows, last_time
+
+
+# Footer reads are I/O bound, so scan all files concurrently
+scan_results = []
+if freshness_jobs:
+    with ThreadPoolExecutor(max_workers=min(32, len(freshness_jobs))) as executor:
+        scan_results = list(executor.map(scan_freshness, freshness_jobs))
+
+now = datetime.now(timezone.utc)
+for asset_type, file, num_rows, last_time in scan_results:
+    row_counts[asset_type] += num_rows
+
+    if last_time is not None:
+        age = now - last_time
+        symbol = file.stem.split("_")[0]
+
+        if asset_type == "crypto":
+            symbol = symbol.replace("_", "/")
+
+        if age < timedelta(minutes=5):
+            fresh_symbols.append(f"{symbol} ({asset_type[0].upper()})")
+        elif age > timedelta(hours=1):
+            stale_symbols.append(f"{symbol} ({asset_type[0].upper()}, {age.days}d)")
+
+for asset_type in asset_types:
     print(f"\n{asset_type.upper()}:")
-    print(f"  Files: {type_files}")
-    print(f"  1min bars: {type_rows:,}")
-    total_files += type_files
-    total_rows += type_rows
+    print(f"  Files: {file_counts[asset_type]}")
+    print(f"  1min bars: {row_counts[asset_type]:,}")
+    total_files += file_counts[asset_type]
+    total_rows += row_counts[asset_type]
 
 print(f"\nTOTAL: {total_files} files, {total_rows:,} data points")
 
@@ -94,30 +158,31 @@ if stale_symbols:
     if len(stale_symbols) > 5:
         print(f"   ... and {len(stale_symbols)-5} more")
 
-# Test MCP functionality
-print("\n🧪 MCP FUNCTIONALITY TEST:")
-print("-" * 40)
-
-try:
-    import sys
-    sys.path.insert(0, str(Path.cwd()))
-    from servers.trading.mcp_server_integrated import MCPServer
-
-    server = MCPServer()
-    test_symbols = ["AAPL", "BTC", "ETH"]
-
-    for symbol in test_symbols:
-        result = server.get_signals(symbol, "1min")
-        if result.get("ready"):
-            price = result.get("snapshot", {}).get("price")
-            trend = result.get("trend_state")
-            print(f"✅ {symbol}: ${price:.2f} ({trend})")
-        else:
-            print(f"❌ {symbol}: {result.get('reason')}")
-except Exception as e:
-    print(f"❌ MCP test failed: {e}")
+# Test MCP functionality (opt-in: importing the server loads pandas, pandas_ta and alpaca)
+if "--deep" in sys.argv:
+    print("\n🧪 MCP FUNCTIONALITY TEST:")
+    print("-" * 40)
+
+    try:
+        sys.path.insert(0, str(Path.cwd()))
+        from servers.trading.mcp_server_integrated import MCPServer
+
+        server = MCPServer()
+        test_symbols = ["AAPL", "BTC", "ETH"]
+
+        for symbol in test_symbols:
+            result = server.get_signals(symbol, "1min")
+            if result.get("ready"):
+                price = result.get("snapshot", {}).get("price")
+                trend = result.get("trend_state")
+                print(f"✅ {symbol}: ${price:.2f} ({trend})")
+            else:
+                print(f"❌ {symbol}: {result.get('reason')}")
+    except Exception as e:
+        print(f"❌ MCP test failed: {e}")
 
 print("\n" + "=" * 60)
 print("Use 'make run' to start data collection")
+print("Use 'python scripts/check_status.py --deep' to also test MCP signals")
 print("Claude Desktop will auto-start MCP server when needed")
 print("=" * 60)
\ No newline at end of file
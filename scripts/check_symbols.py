@@ -3,6 +3,7 @@
 Check which symbols from watchlist are available on Alpaca
 """
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 from alpaca.trading.client import TradingClient
 from alpaca.trading.requests import GetAssetsRequest
@@ -17,6 +18,10 @@ load_dotenv()
 API_KEY = os.getenv("ALPACA_API_KEY")
 SECRET_KEY = os.getenv("ALPACA_SECRET_KEY")
 
+# Watchlist entries that are crypto base symbols (quoted against USD)
+CRYPTO_SYMBOLS = frozenset({"BTC", "ETH", "BCH", "LTC", "UNI", "LINK", "DOGE", "SHIB"})
+
+@lru_cache(maxsize=1)
 def load_watchlist():
     """Load symbols from watchlist file"""
     symbols = {"stocks": [], "crypto": []}
@@ -26,7 +31,7 @@ def load_watchlist():
                 line = line.strip()
                 if line and not line.startswith("#"):
                     symbol = line.upper()
-                    if symbol in ["BTC", "ETH", "BCH", "LTC", "UNI", "LINK", "DOGE", "SHIB"]:
+                    if symbol in CRYPTO_SYMBOLS:
                         symbols["crypto"].append(f"{symbol}USD")
                     else:
                         symbols["stocks"].append(symbol)
@@ -47,30 +52,55 @@ def check_tradeable_assets():
     assets_request = GetAssetsRequest(status="active", asset_class="us_equity")
     assets = trading.get_all_assets(assets_request)
 
-    # Create a set of tradeable symbols
-    tradeable_symbols = {asset.symbol for asset in assets if asset.tradable}
+    # Index tradeable assets by symbol - get_all_assets already has the details
+    tradeable_assets = {asset.symbol: asset for asset in assets if asset.tradable}
 
-    print(f"Total tradeable stocks on Alpaca: {len(tradeable_symbols)}\n")
+    print(f"Total tradeable stocks on Alpaca: {len(tradeable_assets)}\n")
 
     # Check each symbol in watchlist
     print("Stock Status:")
     for symbol in symbols["stocks"]:
-        if symbol in tradeable_symbols:
-            # Get asset details
-            try:
-                asset = trading.get_asset(symbol)
-                status = f"✅ Available - {asset.name[:30]}"
-                if not asset.easy_to_borrow:
-                    status += " (Hard to borrow)"
-                if asset.marginable:
-                    status += " (Marginable)"
-            except:
-                status = "✅ Available"
+        asset = tradeable_assets.get(symbol)
+        if asset is not None:
+            status = f"✅ Available - {(asset.name or '')[:30]}"
+            if not asset.easy_to_borrow:
+                status += " (Hard to borrow)"
+            if asset.marginable:
+                status += " (Marginable)"
         else:
             status = "❌ Not available on Alpaca"
         print(f"  {symbol:6} {status}")
 
-    return tradeable_symbols
+    return set(tradeable_assets)
+
+def fetch_recent_crypto_bars(crypto_client, symbols):
+    """Last hour of minute bars for symbols, as (bars by symbol, error by symbol)
+
+    Tries one batched request first. If Alpaca rejects the batch (e.g. one
+    unknown pair), each symbol is retried on its own so a single bad symbol
+    only marks itself unavailable.
+    """
+    def request_bars(symbol_or_symbols):
+        request = CryptoBarsRequest(
+            symbol_or_symbols=symbol_or_symbols,
+            timeframe=TimeFrame.Minute,
+            start=datetime.now() - timedelta(hours=1)
+        )
+        return crypto_client.get_crypto_bars(request).data
+
+    try:
+        return request_bars(symbols), {}
+    except Exception:
+        pass
+
+    bar_data = {}
+    errors = {}
+    for symbol in symbols:
+        try:
+            bar_data.update(request_bars(symbol))
+        except Exception as e:
+            errors[symbol] = str(e)[:50]
+    return bar_data, errors
 
 def check_crypto_availability():
     """Check which cryptos are available and have recent data"""
@@ -88,40 +118,24 @@ def check_crypto_availability():
 
     print(f"Testing crypto symbols from watchlist: {symbols['crypto']}\n")
 
+    # One request covers both the watchlist and the other known pairs
+    all_symbols = list(dict.fromkeys([*symbols["crypto"], *all_crypto]))
+    bar_data, errors = fetch_recent_crypto_bars(crypto_client, all_symbols)
+
     print("Crypto Status:")
     for symbol in symbols["crypto"]:
-        try:
-            # Try to get recent bars
-            request = CryptoBarsRequest(
-                symbol_or_symbols=symbol,
-                timeframe=TimeFrame.Minute,
-                start=datetime.now() - timedelta(hours=1)
-            )
-            bars = crypto_client.get_crypto_bars(request)
-
-            if symbol in bars.data and len(bars.data[symbol]) > 0:
-                latest_bar = bars.data[symbol][-1]
-                print(f"  {symbol:8} ✅ Available - Latest: ${latest_bar.close:.2f} @ {latest_bar.timestamp}")
-            else:
-                print(f"  {symbol:8} ⚠️  Available but no recent data")
-        except Exception as e:
-            print(f"  {symbol:8} ❌ Not available: {str(e)[:50]}")
+        if symbol in errors:
+            print(f"  {symbol:8} ❌ Not available: {errors[symbol]}")
+        elif bar_data.get(symbol):
+            latest_bar = bar_data[symbol][-1]
+            print(f"  {symbol:8} ✅ Available - Latest: ${latest_bar.close:.2f} @ {latest_bar.timestamp}")
+        else:
+            print(f"  {symbol:8} ⚠️  Available but no recent data")
 
     print(f"\nOther available crypto on Alpaca:")
     for symbol in all_crypto:
-        if symbol not in symbols["crypto"]:
-            try:
-                request = CryptoBarsRequest(
-                    symbol_or_symbols=symbol,
-                    timeframe=TimeFrame.Minute,
-                    start=datetime.now() - timedelta(hours=1),
-                    limit=1
-                )
-                bars = crypto_client.get_crypto_bars(request)
-                if symbol in bars.data and len(bars.data[symbol]) > 0:
-                    print(f"  {symbol:8} (not in watchlist)")
-            except:
-                pass
+        if symbol not in symbols["crypto"] and bar_data.get(symbol):
+            print(f"  {symbol:8} (not in watchlist)")
 
 async def check_live_data_flow():
     """Check if data is currently flowing"""
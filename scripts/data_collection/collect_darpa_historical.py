@@ -4,12 +4,16 @@ Collect historical data for DARPA frontier tech tickers
 This script fetches and stores historical data needed for signal generation
 """
 
+import asyncio
 import os
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 import pytz
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from dotenv import load_dotenv
 
 # Setup paths
@@ -40,21 +44,121 @@ def ensure_directories():
             path = DATA_DIR / asset_type / timeframe
             path.mkdir(parents=True, exist_ok=True)
 
-def collect_historical_data(symbol: str, days_back: int = 30):
-    """Collect historical data for a symbol"""
+def bars_to_dataframe(symbol_bars) -> pd.DataFrame:
+    """Build an OHLCV DataFrame column by column from a list of Alpaca bars"""
+    n = len(symbol_bars)
+
+    def column(attr, dtype):
+        return np.fromiter((getattr(bar, attr) or 0 for bar in symbol_bars), dtype=dtype, count=n)
+
+    return pd.DataFrame({
+        'time': pd.to_datetime([bar.timestamp for bar in symbol_bars]),
+        'open': column('open', np.float64),
+        'high': column('high', np.float64),
+        'low': column('low', np.float64),
+        'close': column('close', np.float64),
+        'volume': column('volume', np.int64),
+        'trade_count': column('trade_count', np.int64),
+        'vwap': column('vwap', np.float64)
+    })
+
+def save_bars_to_parquet(symbol: str, tf_name: str, symbol_bars, month_str: str) -> int:
+    """Write one symbol's bars for a timeframe to its monthly parquet file, returning the row count"""
+    df = bars_to_dataframe(symbol_bars)
+
+    file_path = DATA_DIR / "stocks" / tf_name / f"{symbol}_{month_str}.parquet"
+
+    # zstd + dictionary-encoded trade_count keeps files small; statistics let
+    # readers (e.g. check_status.py) get the last bar time from the footer
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(
+        table,
+        file_path,
+        compression='zstd',
+        compression_level=3,
+        use_dictionary=['trade_count'],
+        data_page_size=1 << 20,
+        write_statistics=True
+    )
+    return table.num_rows
+
+def fetch_timeframe_bars(client, symbols: list[str], tf, tf_name: str, start, end):
+    """Fetch bars for all symbols at one timeframe
+
+    Returns (bars, feed_note, errors) with bars a dict of symbol -> list of
+    Alpaca bars on every path; falls back to the IEX feed when the
+    subscription does not cover SIP. If the batched request fails for any
+    other reason (e.g. one delisted ticker), each symbol is fetched on its
+    own so only the bad ones are lost; errors maps those symbols to messages.
+    """
+    def request_bars(symbol_or_symbols):
+        request = StockBarsRequest(
+            symbol_or_symbols=symbol_or_symbols,
+            start=start,
+            end=end,
+            timeframe=tf,
+            adjustment='all',
+            feed='sip' if tf_name == 'daily' else 'iex'
+        )
+
+        try:
+            return client.get_stock_bars(request), ""
+        except Exception as e:
+            if "subscription does not permit" not in str(e):
+                raise
+
+        # Try with IEX feed
+        request.feed = 'iex'
+        return client.get_stock_bars(request), " (IEX feed)"
+
+    try:
+        bars, feed_note = request_bars(symbols)
+        return bars.data, feed_note, {}
+    except Exception as batch_error:
+        if len(symbols) == 1:
+            raise
+        print(f"  ⚠️  {tf_name} batch failed ({str(batch_error)[:50]}), retrying per symbol")
+
+    bars = {}
+    feed_note = ""
+    errors = {}
+    for symbol in symbols:
+        try:
+            symbol_bars, note = request_bars(symbol)
+        except Exception as e:
+            errors[symbol] = str(e)[:50]
+            continue
+        bars.update(symbol_bars.data)
+        feed_note = feed_note or note
+    return bars, feed_note, errors
+
+async def fetch_all_timeframes(client, symbols: list[str], timeframes, start, end):
+    """Fetch every timeframe concurrently; failed timeframes yield their exception"""
+    return await asyncio.gather(
+        *(asyncio.to_thread(fetch_timeframe_bars, client, symbols, tf, tf_name, start, end)
+          for tf, tf_name in timeframes),
+        return_exceptions=True
+    )
+
+def collect_historical_data(symbols: list[str], days_back: int = 30) -> set[str]:
+    """Collect historical data for a batch of symbols (one request per timeframe)
+
+    Returns the set of symbols for which at least one timeframe was saved.
+    """
 
     api_key = os.getenv("ALPACA_API_KEY")
     secret_key = os.getenv("ALPACA_SECRET_KEY")
 
     if not api_key or not secret_key:
         print("❌ API keys not configured")
-        return False
+        return set()
 
     client = StockHistoricalDataClient(api_key, secret_key, raw_data=False)
 
     # Calculate date range
     end = datetime.now(pytz.UTC)
     start = end - timedelta(days=days_back)
+    month_str = datetime.now().strftime("%Y-%m")
 
     # Define timeframes - use the enum values directly
     timeframes = [
@@ -63,82 +167,34 @@ def collect_historical_data(symbol: str, days_back: int = 30):
         (TimeFrame.Day, "daily")
     ]
 
-    success_count = 0
+    # Requests are latency bound, so run all timeframes at once
+    results = asyncio.run(fetch_all_timeframes(client, symbols, timeframes, start, end))
 
-    for tf, tf_name in timeframes:
-        try:
-            # Fetch data
-            request = StockBarsRequest(
-                symbol_or_symbols=symbol,
-                start=start,
-                end=end,
-                timeframe=tf,
-                adjustment='all',
-                feed='sip' if tf_name == 'daily' else 'iex'
-            )
-
-            bars = client.get_stock_bars(request)
-
-            if symbol in bars and len(bars[symbol]) > 0:
-                # Convert to DataFrame
-                data = []
-                for bar in bars[symbol]:
-                    data.append({
-                        'time': bar.timestamp,
-                        'open': float(bar.open),
-                        'high': float(bar.high),
-                        'low': float(bar.low),
-                        'close': float(bar.close),
-                        'volume': int(bar.volume),
-                        'trade_count': int(bar.trade_count) if bar.trade_count else 0,
-                        'vwap': float(bar.vwap) if bar.vwap else 0
-                    })
-
-                df = pd.DataFrame(data)
-
-                # Save to parquet
-                month_str = datetime.now().strftime("%Y-%m")
-                file_path = DATA_DIR / "stocks" / tf_name / f"{symbol}_{month_str}.parquet"
-
-                df.to_parquet(file_path, compression='snappy')
-                print(f"  ✅ {tf_name}: {len(df)} bars saved")
-                success_count += 1
-            else:
-                print(f"  ⏭️  {tf_name}: No data available")
+    collected = set()
 
-        except Exception as e:
-            if "subscription does not permit" in str(e):
-                # Try with IEX feed
+    for (tf, tf_name), result in zip(timeframes, results):
+        print(f"\n⏱️  {tf_name}:")
+
+        if isinstance(result, Exception):
+            print(f"  ❌ {str(result)[:50]}")
+            continue
+
+        bars, feed_note, errors = result
+
+        for symbol in symbols:
+            if symbol in errors:
+                print(f"  ❌ {symbol}: {errors[symbol]}")
+            elif symbol in bars and len(bars[symbol]) > 0:
                 try:
-                    request.feed = 'iex'
-                    bars = client.get_stock_bars(request)
-
-                    if symbol in bars and len(bars[symbol]) > 0:
-                        data = []
-                        for bar in bars[symbol]:
-                            data.append({
-                                'time': bar.timestamp,
-                                'open': float(bar.open),
-                                'high': float(bar.high),
-                                'low': float(bar.low),
-                                'close': float(bar.close),
-                                'volume': int(bar.volume),
-                                'trade_count': 0,
-                                'vwap': 0
-                            })
-
-                        df = pd.DataFrame(data)
-                        month_str = datetime.now().strftime("%Y-%m")
-                        file_path = DATA_DIR / "stocks" / tf_name / f"{symbol}_{month_str}.parquet"
-                        df.to_parquet(file_path, compression='snappy')
-                        print(f"  ✅ {tf_name}: {len(df)} bars saved (IEX feed)")
-                        success_count += 1
-                except Exception as e2:
-                    print(f"  ❌ {tf_name}: {str(e2)[:50]}")
+                    row_count = save_bars_to_parquet(symbol, tf_name, bars[symbol], month_str)
+                    print(f"  ✅ {symbol}: {row_count} bars saved{feed_note}")
+                    collected.add(symbol)
+                except Exception as e:
+                    print(f"  ❌ {symbol}: {str(e)[:50]}")
             else:
-                print(f"  ❌ {tf_name}: {str(e)[:50]}")
+                print(f"  ⏭️  {symbol}: No data available")
 
-    return success_count > 0
+    return collected
 
 def main():
     print("=" * 60)
@@ -147,20 +203,16 @@ def main():
 
     ensure_directories()
 
-    # Collect data for all DARPA tickers
-    total_tickers = 0
-    success_tickers = 0
-
     for category, tickers in DARPA_TICKERS.items():
-        print(f"\n📊 {category.upper()} SECTOR")
-        print("-" * 40)
+        print(f"\n📊 {category.upper()} SECTOR: {', '.join(tickers)}")
 
-        for ticker in tickers:
-            print(f"\n{ticker}:")
-            total_tickers += 1
+    # Collect data for all DARPA tickers in one batch
+    all_tickers = [ticker for tickers in DARPA_TICKERS.values() for ticker in tickers]
+    print("-" * 40)
+    collected = collect_historical_data(all_tickers, days_back=30)
 
-            if collect_historical_data(ticker, days_back=30):
-                success_tickers += 1
+    total_tickers = len(all_tickers)
+    success_tickers = len(collected)
 
     print("\n" + "=" * 60)
     print("📈 COLLECTION COMPLETE")
@@ -0,0 +1,34 @@
+"""Gunicorn settings for the MCP REST API (scripts/mcp_rest_api.py)
+
+Run from the project root:
+    gunicorn -c scripts/gunicorn_conf.py scripts.mcp_rest_api:app
+
+Gunicorn only manages processes here; each worker is a uvicorn ASGI worker
+(uvloop + httptools) serving the FastAPI app.
+
+The app is preloaded and the MCPServer is warmed in the master, so pandas,
+numpy and the server are imported once and shared copy-on-write with the
+forked workers.
+"""
+
+import multiprocessing
+import os
+import sys
+
+bind = os.getenv("MCP_REST_BIND", "0.0.0.0:5000")
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("MCP_REST_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+keepalive = 5
+preload_app = True
+
+def when_ready(server):
+    """Build the lazily created MCPServer in the master before workers fork"""
+    app_module = sys.modules.get("scripts.mcp_rest_api")
+    if app_module is not None:
+        app_module.get_server()
+
+def post_fork(server, worker):
+    """Give each worker its own log thread and client connections"""
+    app_module = sys.modules.get("scripts.mcp_rest_api")
+    if app_module is not None:
+        app_module.reinit_after_fork()
@@ -1,12 +1,26 @@
 #!/usr/bin/env python3
 """REST API wrapper for MCP server - share with any agent"""
 
-from flask import Flask, jsonify, request
-from flask_cors import CORS
+import asyncio
+import functools
+import math
+import os
+import shutil
 import sys
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime
 
+import anyio.to_thread
+import orjson
+from cachetools import TTLCache
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+
 # Setup paths
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -14,16 +28,155 @@ sys.path.insert(0, str(Path(__file__).parent))
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent / ".env")
 
-from servers.trading.mcp_server_integrated import MCPServer
+# MCPServer methods are blocking, so they run in anyio's worker threads.
+# Raise the default 40-thread limit so slow upstream fetches don't queue.
+THREADPOOL_SIZE = 300
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    # Build the MCPServer before serving, in a worker thread, so the first request
+    # doesn't construct it on the event loop. Under gunicorn it was already built
+    # in the master (when_ready) and this returns the cached instance.
+    await run_in_threadpool(get_server)
+    yield
+
+app = FastAPI(
+    title="MCP Trading Signals API",
+    version="1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])  # Allow cross-origin requests
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)  # Event and watchlist payloads compress well
+
+@functools.lru_cache(maxsize=1)
+def get_server():
+    """Create the MCPServer on first use - importing it pulls in pandas, pandas_ta and alpaca"""
+    from servers.trading.mcp_server_integrated import MCPServer
+    return MCPServer()
+
+def reinit_after_fork():
+    """Per-worker setup for a preloaded app: threads and connections don't survive fork"""
+    if get_server.cache_info().currsize == 0:
+        return
+
+    from servers.trading.mcp_server_integrated import restart_log_listener
+    restart_log_listener()
+    get_server().reconnect()
+
+# Response cache TTLs in seconds, overridable via MCP_REST_TTL_<ENDPOINT> env vars
+CACHE_TTLS = {
+    "signals": 5,
+    "watchlist": 30,
+    "darpa_events": 300,
+    "macro_events": 300,
+    "powell_schedule": 300,
+}
+RESPONSE_CACHES = {
+    endpoint: TTLCache(maxsize=1024, ttl=float(os.getenv(f"MCP_REST_TTL_{endpoint.upper()}", ttl)))
+    for endpoint, ttl in CACHE_TTLS.items()
+}
+_inflight = {}
+
+def dump_json(obj) -> bytes:
+    """Serialize a response body with orjson; naive datetimes are treated as UTC"""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY)
+
+def is_error_result(result) -> bool:
+    """True for the error payloads MCPServer methods return instead of raising"""
+    return isinstance(result, dict) and (result.get("status") == "error" or "error" in result)
+
+async def cached_json(endpoint, request: Request, compute, *args):
+    """Serve a GET response from the endpoint's TTL cache, computing it at most once per key
+
+    compute(*args) runs in the threadpool. Concurrent misses for the same path
+    and query args await the same in-flight call instead of each calling
+    upstream (single-flight). Only successful results are cached: exceptions
+    propagate to the route's error handling, and error payloads are returned
+    but not cached.
+    """
+    cache = RESPONSE_CACHES[endpoint]
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+
+    body = cache.get(key)
+    if body is None:
+        future = _inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(run_in_threadpool(compute, *args))
+            _inflight[key] = future
+            future.add_done_callback(functools.partial(_store_result, cache, key))
+        result = await asyncio.shield(future)
+        body = cache.get(key) or dump_json(result)
+
+    return Response(body, media_type="application/json")
 
-app = Flask(__name__)
-CORS(app)  # Allow cross-origin requests
-server = MCPServer()
+def _store_result(cache, key, future):
+    """Done callback of an in-flight compute: clear the in-flight slot and cache a success
 
-@app.route('/')
-def home():
+    Runs even if every waiting request was cancelled (client disconnects), so
+    a finished fetch is never wasted and a cancellation never reaches the
+    shared future.
+    """
+    if _inflight.get(key) is future:
+        del _inflight[key]
+    if future.cancelled() or future.exception() is not None:
+        return
+    result = future.result()
+    if not is_error_result(result):
+        cache[key] = dump_json(result)
+
+# Per-client request limits per minute, overridable via MCP_REST_RATE_<ENDPOINT> env vars.
+# Clients are keyed by X-Agent-Id, falling back to the remote address; limits apply per worker.
+RATE_LIMITS = {
+    "signals": 60,
+    "tickers_check": 10,
+}
+RATE_PER_MINUTE = {
+    endpoint: int(os.getenv(f"MCP_REST_RATE_{endpoint.upper()}", limit))
+    for endpoint, limit in RATE_LIMITS.items()
+}
+_buckets = TTLCache(maxsize=10000, ttl=600)  # (endpoint, client) -> (tokens, monotonic time)
+
+def rate_limited(endpoint, request: Request):
+    """Take a token from the client's bucket for endpoint; returns a 429 response if it is empty"""
+    capacity = RATE_PER_MINUTE[endpoint]
+    refill_per_second = capacity / 60
+    client = request.headers.get("X-Agent-Id") or (request.client.host if request.client else "unknown")
+    key = (endpoint, client)
+
+    now = time.monotonic()
+    tokens, last = _buckets.get(key, (capacity, now))
+    tokens = min(capacity, tokens + (now - last) * refill_per_second)
+
+    if tokens < 1:
+        _buckets[key] = (tokens, now)
+        retry_after = math.ceil((1 - tokens) / refill_per_second)
+        return ORJSONResponse(
+            {"error": "Rate limit exceeded"},
+            status_code=429,
+            headers={"Retry-After": str(retry_after)}
+        )
+
+    _buckets[key] = (tokens - 1, now)
+    return None
+
+_now_iso = [0, ""]  # [epoch second, ISO timestamp for that second]
+
+def now_iso():
+    """Local time as an ISO string, formatted at most once per second"""
+    second = int(time.time())
+    if second != _now_iso[0]:
+        _now_iso[:] = [second, datetime.fromtimestamp(second).isoformat()]
+    return _now_iso[1]
+
+def error_response(message, status_code=500):
+    return ORJSONResponse({"error": message}, status_code=status_code)
+
+@app.get('/')
+async def home():
     """API documentation"""
-    return jsonify({
+    return {
         "name": "MCP Trading Signals API",
         "version": "1.0",
         "endpoints": {
@@ -35,86 +188,84 @@ def home():
             "GET /api/status": "Server status"
         },
         "example": "/api/signals/IONQ?timeframe=5min"
-    })
+    }
 
-@app.route('/api/status')
-def status():
+@app.get('/api/status')
+async def status():
     """Server status"""
-    return jsonify({
+    return {
         "status": "online",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso(),
         "capabilities": {
             "trading_signals": True,
             "darpa_monitoring": True,
             "macro_events": True,
             "news_sentiment": True
         }
-    })
+    }
 
-@app.route('/api/signals/<symbol>')
-def get_signals(symbol):
+@app.get('/api/signals/{symbol}')
+async def get_signals(symbol: str, request: Request, timeframe: str = '1min'):
     """Get trading signals for a symbol"""
+    limited = rate_limited("signals", request)
+    if limited:
+        return limited
+
     try:
-        timeframe = request.args.get('timeframe', '1min')
-        result = server.get_signals(symbol, timeframe)
-        return jsonify(result)
+        return await cached_json("signals", request, get_server().get_signals, symbol, timeframe)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return error_response(str(e))
 
-@app.route('/api/watchlist')
-def get_watchlist():
+@app.get('/api/watchlist')
+async def get_watchlist(request: Request):
     """Get current watchlist"""
     try:
-        result = server.get_watchlist()
-        return jsonify(result)
+        return await cached_json("watchlist", request, get_server().get_watchlist)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return error_response(str(e))
 
-@app.route('/api/darpa/events')
-def get_darpa_events():
+@app.get('/api/darpa/events')
+async def get_darpa_events(request: Request, hours_back: int = 24, source: str = 'all'):
     """Get DARPA frontier tech events"""
     try:
-        hours_back = int(request.args.get('hours_back', 24))
-        source = request.args.get('source', 'all')
-        result = server.get_darpa_events(hours_back, source)
-        return jsonify(result)
+        return await cached_json("darpa_events", request, get_server().get_darpa_events, hours_back, source)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return error_response(str(e))
 
-@app.route('/api/macro/events')
-def get_macro_events():
+@app.get('/api/macro/events')
+async def get_macro_events(request: Request, hours_ahead: int = 48, min_importance: str = 'medium'):
     """Get macro economic events"""
     try:
-        hours_ahead = int(request.args.get('hours_ahead', 48))
-        min_importance = request.args.get('min_importance', 'medium')
-        result = server.get_macro_events(hours_ahead, min_importance)
-        return jsonify(result)
+        return await cached_json("macro_events", request, get_server().get_macro_events, hours_ahead, min_importance)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return error_response(str(e))
 
-@app.route('/api/tickers/check', methods=['POST'])
-def check_tickers():
+@app.post('/api/tickers/check')
+async def check_tickers(request: Request):
     """Check ticker availability"""
+    limited = rate_limited("tickers_check", request)
+    if limited:
+        return limited
+
     try:
-        data = request.get_json()
+        data = await request.json()
         symbols = data.get('symbols', [])
 
         if not symbols:
-            return jsonify({"error": "No symbols provided"}), 400
+            return error_response("No symbols provided", 400)
 
-        result = server.check_ticker_availability(symbols)
-        return jsonify(result)
+        result = await run_in_threadpool(get_server().check_ticker_availability, symbols)
+        return Response(dump_json(result), media_type="application/json")
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return error_response(str(e))
 
-@app.route('/api/powell/schedule')
-def get_powell_schedule():
+@app.get('/api/powell/schedule')
+async def get_powell_schedule(request: Request):
     """Get Powell speaking schedule"""
     try:
-        result = server.get_powell_schedule()
-        return jsonify(result)
+        return await cached_json("powell_schedule", request, get_server().get_powell_schedule)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return error_response(str(e))
 
 if __name__ == '__main__':
     print("=" * 60)
@@ -136,4 +287,19 @@ if __name__ == '__main__':
     print("\n🔗 Share this URL with ChatGPT, local models, or any HTTP client")
     print("=" * 60)
 
-    app.run(host='0.0.0.0', port=5000, debug=False)
\ No newline at end of file
+    # Worker processes import the app by module path, so run from the project root
+    os.chdir(Path(__file__).parent.parent)
+
+    # Prefer gunicorn managing uvicorn workers; otherwise let uvicorn spawn its own
+    if shutil.which("gunicorn"):
+        os.execvp("gunicorn", ["gunicorn", "-c", "scripts/gunicorn_conf.py", "scripts.mcp_rest_api:app"])
+
+    import uvicorn
+    uvicorn.run(
+        "scripts.mcp_rest_api:app",
+        host="0.0.0.0",
+        port=5000,
+        workers=int(os.getenv("MCP_REST_WORKERS", 4)),
+        loop="uvloop",
+        http="httptools"
+    )
@@ -7,8 +7,15 @@ Run this as a background service to continuously monitor DARPA events
 import os
 import sys
 import time
-import json
-import schedule
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import sqlite3
+import signal
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import orjson
 from datetime import datetime, timezone
 from pathlib import Path
 from dotenv import load_dotenv
@@ -20,85 +27,195 @@ sys.path.insert(0, str(PROJECT_ROOT))
 # Load environment
 load_dotenv(PROJECT_ROOT / ".env")
 
-from servers.trading.mcp_server_integrated import MCPServer
+from servers.trading.mcp_server_integrated import MCPServer, DARPA_EVENTS_LIMIT
 from servers.trading.darpa_events_monitor import DARPAEventsMonitor
 
 # Configuration
 CHECK_INTERVAL_MINUTES = 30  # Check for new events every 30 minutes
 TICKER_CHECK_HOURS = 4      # Check ticker prices every 4 hours
-ALERT_LOG = PROJECT_ROOT / "data" / "darpa_alerts.json"
+TICKER_CACHE_SECONDS = 60   # Reuse ticker lookups newer than this
+ALERT_LOG = PROJECT_ROOT / "data" / "darpa_alerts.jsonl"  # One JSON alert per line, append-only
+LEGACY_ALERT_LOG = PROJECT_ROOT / "data" / "darpa_alerts.json"  # Old single JSON array format
+LOG_FORMAT = os.getenv("DARPA_LOG_FORMAT", "text")  # "json" for one JSON object per log line
+DARPA_SOURCES = ["darpa", "dod_contracts", "arxiv"]  # Fetched concurrently in daemon mode
+SEEN_DB = PROJECT_ROOT / "data" / "darpa_seen.db"  # Event ids already processed, kept across restarts
+SEEN_RETENTION_DAYS = 7     # Forget seen event ids older than this
+SEEN_PRUNE_INTERVAL_SECONDS = 86400  # Run the retention DELETE at most once a day
+RECENT_EVENTS_MAX = 1024    # New events kept in memory for diagnostics
+
+class DaemonLogFormatter(logging.Formatter):
+    """Format daemon log records as timestamped text, or as NDJSON when as_json is set
+
+    Structured values passed as extra={"fields": {...}} become JSON keys.
+    """
+
+    def __init__(self, as_json=False):
+        super().__init__()
+        self.as_json = as_json
+
+    def format(self, record):
+        timestamp = fmt_now(int(record.created))
+        if self.as_json:
+            entry = {"ts": timestamp, "level": record.levelname, "msg": record.getMessage()}
+            entry.update(getattr(record, "fields", {}))
+            return orjson.dumps(entry, default=str).decode()
+        return f"[{timestamp}] {record.getMessage()}"
+
+def setup_logging():
+    """Send daemon logs through a queue so checks never block on stdout writes"""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(DaemonLogFormatter(as_json=LOG_FORMAT == "json"))
+    listener = QueueListener(log_queue, handler)
+
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False  # Keep daemon output out of the MCP server's log file
+    listener.start()
+    return listener
+
+logger = logging.getLogger("darpa")
 
 class DARPAMonitorDaemon:
     def __init__(self):
         self.server = MCPServer()
-        self.monitor = DARPAEventsMonitor()
-        self.last_events = {}
+        self.monitor = DARPAEventsMonitor(session=self.server.http)
+        # Share one monitor so concurrent per-source fetches don't each lazily create their own
+        self.server.darpa_monitor = self.monitor
+        self.new_event_count = 0
         self.high_importance_alerts = []
+        self._ticker_cache = {}  # symbol -> (monotonic fetch time, availability info)
 
         # Ensure alert log directory exists
         ALERT_LOG.parent.mkdir(parents=True, exist_ok=True)
+        migrate_alerts_to_jsonl()
+        self.seen_db = open_seen_db(SEEN_DB)
+        self.seen_ids = load_seen_ids(self.seen_db)  # In-memory mirror of the seen table
+        self._last_prune = 0.0  # Epoch time of the last retention pass; 0 prunes on the first check
+        self.recent_events = deque(maxlen=RECENT_EVENTS_MAX)
 
     def check_darpa_events(self):
         """Check for new DARPA events and alert on high-importance ones"""
-        print(f"\n[{datetime.now()}] Checking DARPA events...")
+        logger.info("Checking DARPA events...")
 
         try:
             # Get events from all sources
             events_result = self.server.get_darpa_events(hours_back=24, source="all")
+            self.process_events(events_result)
 
-            if events_result['status'] == 'success':
-                new_count = 0
-                high_importance_count = 0
+        except Exception as e:
+            logger.error("  ❌ Error checking events: %s", e)
+
+    async def check_darpa_events_async(self):
+        """Check for new DARPA events, fetching each source concurrently"""
+        logger.info("Checking DARPA events...")
+
+        try:
+            results = await asyncio.gather(*(
+                asyncio.to_thread(self.server.get_darpa_events, 24, source)
+                for source in DARPA_SOURCES
+            ))
+            # SQLite writes and alert file appends stay off the event loop
+            await asyncio.to_thread(self.process_events, merge_event_results(results))
 
-                for event in events_result['events']:
-                    event_id = f"{event['source']}_{event['datetime']}"
+        except Exception as e:
+            logger.error("  ❌ Error checking events: %s", e)
 
-                    # Check if this is a new event
-                    if event_id not in self.last_events:
-                        new_count += 1
-                        self.last_events[event_id] = event
+    def process_events(self, events_result):
+        """Record new events from a get_darpa_events result and alert on high-importance ones"""
+        if events_result['status'] != 'success':
+            return
 
-                        # Alert on high-importance events
-                        if event['importance'] == 'high':
-                            high_importance_count += 1
-                            self.alert_high_importance(event)
+        new_count = 0
+        high_importance_count = 0
+        now = time.time()
 
-                        # Check if event mentions specific tickers
-                        if event.get('companies'):
-                            self.check_ticker_impact(event)
+        for event in events_result['events']:
+            event_id = f"{event['source']}_{event['datetime']}"
 
-                print(f"  ✅ Found {events_result['total_events']} events")
-                print(f"  📢 {new_count} new events ({high_importance_count} high importance)")
+            # Known events cost one set lookup; only new ids touch the database
+            if event_id in self.seen_ids:
+                continue
+            self.seen_ids.add(event_id)
+            self.seen_db.execute("INSERT OR IGNORE INTO seen VALUES (?, ?)", (event_id, now))
+            self.recent_events.append(event)
+            new_count += 1
 
-                if events_result.get('mentioned_tickers'):
-                    print(f"  🎯 Tickers mentioned: {', '.join(events_result['mentioned_tickers'][:5])}")
+            # Alert on high-importance events
+            if event['importance'] == 'high':
+                high_importance_count += 1
+                self.alert_high_importance(event)
 
-        except Exception as e:
-            print(f"  ❌ Error checking events: {e}")
+            # Check if event mentions specific tickers
+            if event.get('companies'):
+                self.check_ticker_impact(event)
+
+        self.new_event_count += new_count
+        if now - self._last_prune >= SEEN_PRUNE_INTERVAL_SECONDS:
+            self.prune_seen(now)
+
+        logger.info("  ✅ Found %d events", events_result['total_events'],
+                    extra={"fields": {"total": events_result['total_events']}})
+        logger.info("  📢 %d new events (%d high importance)", new_count, high_importance_count,
+                    extra={"fields": {"new": new_count, "high_importance": high_importance_count}})
+
+        if events_result.get('mentioned_tickers'):
+            logger.info("  🎯 Tickers mentioned: %s", ', '.join(events_result['mentioned_tickers'][:5]))
+
+    def prune_seen(self, now):
+        """Forget seen ids older than SEEN_RETENTION_DAYS, in the table and the in-memory set"""
+        cutoff = now - SEEN_RETENTION_DAYS * 86400
+        # Only this daemon writes the table, so the selected ids are exactly the ones deleted
+        expired = [event_id for (event_id,) in self.seen_db.execute("SELECT event_id FROM seen WHERE ts < ?", (cutoff,))]
+        if expired:
+            self.seen_db.execute("DELETE FROM seen WHERE ts < ?", (cutoff,))
+            self.seen_ids.difference_update(expired)
+        self._last_prune = now
+
+    def get_ticker_info(self, symbols):
+        """Get availability info for symbols, fetching only stale or missing ones in a single batch"""
+        symbols = list(dict.fromkeys(symbols))
+        now = time.monotonic()
+        misses = [
+            symbol for symbol in symbols
+            if symbol not in self._ticker_cache or now - self._ticker_cache[symbol][0] >= TICKER_CACHE_SECONDS
+        ]
+
+        if misses:
+            result = self.server.check_ticker_availability(misses)
+            if result['status'] != 'success':
+                raise RuntimeError(result.get('error', 'ticker lookup failed'))
+            fetched_at = time.monotonic()
+            for symbol, info in result['results'].items():
+                self._ticker_cache[symbol] = (fetched_at, info)
+
+        hits = len(symbols) - len(misses)
+        logger.info("  🗃️  Ticker cache: %d/%d hits", hits, len(symbols))
+
+        return {symbol: self._ticker_cache[symbol][1] for symbol in symbols if symbol in self._ticker_cache}
 
     def check_ticker_prices(self):
         """Check prices for DARPA tickers"""
-        print(f"\n[{datetime.now()}] Checking DARPA ticker prices...")
+        logger.info("Checking DARPA ticker prices...")
 
         darpa_tickers = ['IONQ', 'QBTS', 'DNA', 'KTOS', 'AVAV', 'BBAI', 'SMR']
 
         try:
-            result = self.server.check_ticker_availability(darpa_tickers)
+            ticker_info = self.get_ticker_info(darpa_tickers)
+            significant_movers = []
 
-            if result['status'] == 'success':
-                significant_movers = []
+            for ticker, info in ticker_info.items():
+                if info['available']:
+                    # Check for significant price movements (implement your logic)
+                    # For now, just track the prices
+                    logger.info("  • %s: $%.2f", ticker, info['last_price'],
+                                extra={"fields": {"ticker": ticker, "price": info['last_price']}})
 
-                for ticker, info in result['results'].items():
-                    if info['available']:
-                        # Check for significant price movements (implement your logic)
-                        # For now, just track the prices
-                        print(f"  • {ticker}: ${info['last_price']:.2f}")
-
-                        # You could add logic here to detect significant moves
-                        # e.g., compare with previous prices, check volume spikes, etc.
+                    # You could add logic here to detect significant moves
+                    # e.g., compare with previous prices, check volume spikes, etc.
 
         except Exception as e:
-            print(f"  ❌ Error checking prices: {e}")
+            logger.error("  ❌ Error checking prices: %s", e)
 
     def alert_high_importance(self, event):
         """Log high-importance events for review"""
@@ -110,33 +227,31 @@ class DARPAMonitorDaemon:
 
         self.high_importance_alerts.append(alert)
 
-        # Save to file
+        # Append to file - a single O_APPEND write keeps each line intact
         try:
-            if ALERT_LOG.exists():
-                with open(ALERT_LOG, 'r') as f:
-                    alerts = json.load(f)
-            else:
-                alerts = []
-
-            alerts.append(alert)
-
-            with open(ALERT_LOG, 'w') as f:
-                json.dump(alerts, f, indent=2, default=str)
-
-            print(f"  🚨 HIGH IMPORTANCE: {event['title'][:60]}...")
-            print(f"     Domain: {event.get('technology_domain', 'unknown')}")
+            line = orjson.dumps(alert, default=str, option=orjson.OPT_APPEND_NEWLINE)
+            fd = os.open(ALERT_LOG, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
+            logger.warning("  🚨 HIGH IMPORTANCE: %s...", event['title'][:60],
+                           extra={"fields": {"domain": event.get('technology_domain', 'unknown'),
+                                             "tickers": event.get('companies') or []}})
+            logger.info("     Domain: %s", event.get('technology_domain', 'unknown'))
             if event.get('companies'):
-                print(f"     Tickers: {', '.join(event['companies'])}")
+                logger.info("     Tickers: %s", ', '.join(event['companies']))
 
         except Exception as e:
-            print(f"  ❌ Error saving alert: {e}")
+            logger.error("  ❌ Error saving alert: %s", e)
 
     def check_ticker_impact(self, event):
         """Check if an event might impact specific tickers"""
         if not event.get('companies'):
             return
 
-        print(f"  💡 Event impacts tickers: {', '.join(event['companies'])}")
+        logger.info("  💡 Event impacts tickers: %s", ', '.join(event['companies']))
 
         # You could add logic here to:
         # 1. Fetch current signals for these tickers
@@ -145,54 +260,168 @@ class DARPAMonitorDaemon:
 
     def run_once(self):
         """Run all checks once"""
-        print("=" * 60)
-        print("🚀 DARPA MONITOR - MANUAL RUN")
-        print("=" * 60)
+        logger.info("=" * 60)
+        logger.info("🚀 DARPA MONITOR - MANUAL RUN")
+        logger.info("=" * 60)
 
         self.check_darpa_events()
         self.check_ticker_prices()
 
-        print("\n" + "=" * 60)
-        print("✅ Check complete")
-        print("=" * 60)
+        logger.info("=" * 60)
+        logger.info("✅ Check complete")
+        logger.info("=" * 60)
 
     def run_daemon(self):
         """Run as a continuous daemon"""
-        print("=" * 60)
-        print("🤖 DARPA MONITOR DAEMON STARTED")
-        print("=" * 60)
-        print(f"Event check interval: {CHECK_INTERVAL_MINUTES} minutes")
-        print(f"Ticker check interval: {TICKER_CHECK_HOURS} hours")
-        print(f"Alert log: {ALERT_LOG}")
-        print("\nPress Ctrl+C to stop\n")
-
-        # Schedule jobs
-        schedule.every(CHECK_INTERVAL_MINUTES).minutes.do(self.check_darpa_events)
-        schedule.every(TICKER_CHECK_HOURS).hours.do(self.check_ticker_prices)
-
-        # Run once immediately
-        self.check_darpa_events()
-        self.check_ticker_prices()
+        logger.info("=" * 60)
+        logger.info("🤖 DARPA MONITOR DAEMON STARTED")
+        logger.info("=" * 60)
+        logger.info("Event check interval: %d minutes", CHECK_INTERVAL_MINUTES)
+        logger.info("Ticker check interval: %d hours", TICKER_CHECK_HOURS)
+        logger.info("Alert log: %s", ALERT_LOG)
+        logger.info("Press Ctrl+C to stop")
 
-        # Keep running
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute for scheduled tasks
+            asyncio.run(self.run_checks_forever())
+            logger.info("🛑 Daemon stopped (SIGTERM)")
         except KeyboardInterrupt:
-            print("\n🛑 Daemon stopped by user")
-            print(f"Processed {len(self.last_events)} total events")
-            print(f"Generated {len(self.high_importance_alerts)} high-importance alerts")
+            logger.info("🛑 Daemon stopped by user")
+
+        logger.info("Processed %d new events", self.new_event_count)
+        logger.info("Generated %d high-importance alerts", len(self.high_importance_alerts))
+
+    async def run_checks_forever(self):
+        """Run both periodic checks as independent tasks, starting immediately
+
+        Returns once SIGTERM is received and any in-progress check has finished.
+        """
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        loop.add_signal_handler(signal.SIGTERM, stop.set)
+
+        # Blocking checks get their own threads so they never queue behind the
+        # per-source event fetches in the default executor
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="darpa-check") as pool:
+            async def check_ticker_prices_async():
+                await loop.run_in_executor(pool, self.check_ticker_prices)
+
+            await asyncio.gather(
+                run_every(self.check_darpa_events_async, CHECK_INTERVAL_MINUTES * 60, stop),
+                run_every(check_ticker_prices_async, TICKER_CHECK_HOURS * 3600, stop)
+            )
+
+def open_seen_db(path):
+    """Open the seen-events store, creating the table if needed"""
+    # Autocommit; WAL keeps the per-event inserts cheap
+    conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS seen (event_id TEXT PRIMARY KEY, ts REAL)")
+    return conn
+
+_now_str = [0, ""]  # [epoch second, formatted local time for that second]
+
+def fmt_now(second=None):
+    """Local time for log lines, formatted at most once per second"""
+    if second is None:
+        second = int(time.time())
+    if second != _now_str[0]:
+        _now_str[:] = [second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))]
+    return _now_str[1]
+
+def load_seen_ids(conn):
+    """Load every event id in the seen table into a set"""
+    return {event_id for (event_id,) in conn.execute("SELECT event_id FROM seen")}
+
+def iter_alerts():
+    """Yield saved alerts one at a time from the JSON-lines alert log"""
+    if not ALERT_LOG.exists():
+        return
+
+    with open(ALERT_LOG, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+def migrate_alerts_to_jsonl():
+    """One-shot conversion of a legacy darpa_alerts.json array into the JSON-lines log
+
+    Legacy alerts are appended to ALERT_LOG and the old file is renamed to
+    darpa_alerts.json.migrated so the conversion never runs twice.
+    """
+    if not LEGACY_ALERT_LOG.exists():
+        return
+
+    try:
+        with open(LEGACY_ALERT_LOG, 'rb') as f:
+            alerts = orjson.loads(f.read())
+
+        with open(ALERT_LOG, 'ab') as f:
+            for alert in alerts:
+                f.write(orjson.dumps(alert, option=orjson.OPT_APPEND_NEWLINE))
+
+        LEGACY_ALERT_LOG.rename(LEGACY_ALERT_LOG.with_suffix('.json.migrated'))
+        logger.info("📦 Migrated %d alerts to %s", len(alerts), ALERT_LOG.name)
+    except Exception as e:
+        logger.error("  ❌ Error migrating legacy alerts: %s", e)
+
+async def run_every(check, interval_seconds, stop):
+    """Await check() every interval_seconds until stop is set
+
+    Runs are scheduled against fixed monotonic deadlines, so a slow check doesn't
+    push later runs back; runs missed while a check overran are skipped. The wait
+    for the next deadline wakes immediately when stop is set.
+    """
+    next_run = time.monotonic()
+    while not stop.is_set():
+        await check()
+
+        now = time.monotonic()
+        while next_run <= now:
+            next_run += interval_seconds
+
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=next_run - now)
+        except asyncio.TimeoutError:
+            pass
+
+def merge_event_results(results):
+    """Combine per-source get_darpa_events results into one result of the same shape
+
+    Events are re-sorted like get_darpa_events (importance, then time, newest
+    first) and capped at the same DARPA_EVENTS_LIMIT, so a merged check holds
+    no more events than a single source="all" call. Tickers keep first-seen order.
+    """
+    succeeded = [result for result in results if result['status'] == 'success']
+    if not succeeded:
+        return results[0] if results else {'status': 'error', 'events': []}
+
+    mentioned_tickers = dict.fromkeys(
+        ticker for result in succeeded for ticker in result.get('mentioned_tickers', [])
+    )
+    events = [event for result in succeeded for event in result['events']]
+    events.sort(key=lambda event: (event['importance'], event['datetime']), reverse=True)
+
+    return {
+        'status': 'success',
+        'total_events': sum(result['total_events'] for result in succeeded),
+        'events': events[:DARPA_EVENTS_LIMIT],
+        'mentioned_tickers': list(mentioned_tickers)
+    }
 
 def main():
-    daemon = DARPAMonitorDaemon()
-
-    if len(sys.argv) > 1 and sys.argv[1] == '--once':
-        # Run once and exit
-        daemon.run_once()
-    else:
-        # Run as daemon
-        daemon.run_daemon()
+    listener = setup_logging()
+    try:
+        daemon = DARPAMonitorDaemon()
+
+        if len(sys.argv) > 1 and sys.argv[1] == '--once':
+            # Run once and exit
+            daemon.run_once()
+        else:
+            # Run as daemon
+            daemon.run_daemon()
+    finally:
+        listener.stop()  # Flush queued log lines
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
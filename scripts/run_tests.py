@@ -31,16 +31,28 @@ def main():
         print(f"  - {test_file.name}")
     print()
 
+    debug = "--debug" in sys.argv
+
     # Run pytest with verbose output
     cmd = [
         sys.executable, "-m", "pytest",
         str(tests_dir),
-        "-v",           # verbose
-        "-s",           # don't capture output
-        "--tb=short",   # shorter traceback format
-        "--color=yes"   # colored output
+        "-v",                   # verbose
+        "--tb=short",           # shorter traceback format
+        "--color=yes",          # colored output
+        "-p", "no:cacheprovider",  # cold runs, no .pytest_cache writes
+        "--durations=10"        # surface the slowest tests
     ]
 
+    if debug:
+        # Interactive debugging: serial run with output capture disabled
+        cmd.append("-s")
+    else:
+        # Tests are I/O bound, so spread files across one worker per CPU
+        cmd += ["-n", "auto", "--dist=loadfile"]
+        if "--offline" in sys.argv:
+            cmd.append("--forked")  # fork each test from a warm worker
+
     print("Running tests...")
     print(f"Command: {' '.join(cmd)}")
     print("-" * 50)
@@ -5,18 +5,46 @@ Tracks government contracts, research publications, and signal events
 for DARPA-style investments in quantum, biotech, defense, and frontier tech
 """
 
+import io
 import os
-import json
+import functools
+import time
+import pickle
+import hashlib
 import logging
 import requests
+import httpx
 import feedparser
+import orjson
+from collections import defaultdict
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict, field
+from typing import Dict, Any, FrozenSet, List, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
 import asyncio
 import re
 from enum import Enum
+import numpy as np
+
+try:
+    import ahocorasick  # Optional: pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from numba import njit  # Optional: JIT keyword scan when pyahocorasick is missing
+except ImportError:
+    njit = None
+
+try:
+    from lxml import etree  # Optional: direct RSS/Atom parsing, feedparser otherwise
+except ImportError:
+    etree = None
+
+try:
+    import ijson  # Optional: stream-parse SAM.gov results instead of loading the whole payload
+except ImportError:
+    ijson = None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -27,6 +55,130 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent.absolute()
 DARPA_CACHE_DIR = PROJECT_ROOT / "data" / "darpa_events"
 DARPA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# SAM.gov search for DARPA opportunities
+SAM_MAX_RESULTS = 20
+SAM_SEARCH_URL = "https://sam.gov/api/prod/sgs/v1/search/"
+SAM_SEARCH_PARAMS = {
+    'index': 'opp',
+    'q': 'DARPA',
+    'page': 0,
+    'sort': '-modifiedDate',
+    'size': SAM_MAX_RESULTS
+}
+ARXIV_FEEDS = ["arxiv_quantum", "arxiv_cs"]
+DOD_MAX_ENTRIES = 20
+ARXIV_MAX_ENTRIES = 10
+
+# Feed item elements for RSS 2.0, RSS 1.0 (RDF) and Atom, and the namespaces their fields use
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+RSS1_NS = "{http://purl.org/rss/1.0/}"
+DC_NS = "{http://purl.org/dc/elements/1.1/}"
+RDF_NS = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+FEED_ITEM_TAGS = ("item", f"{RSS1_NS}item", f"{ATOM_NS}entry")
+
+# Async fetch limits: requests in flight at once, and the shared client's connection pool
+MAX_CONCURRENT_FETCHES = 5
+ASYNC_CLIENT_LIMITS = dict(max_connections=10, keepalive_expiry=30)
+USER_AGENT = "darpa-monitor/1.0"
+
+# Dollar amounts with an optional unit, e.g. "$1,250,000" or "$4.5 million"
+CONTRACT_VALUE_RE = re.compile(r'\$([0-9,]+(?:\.[0-9]+)?)\s*(million|billion)?', re.IGNORECASE)
+CONTRACT_VALUE_UNITS = {'million': 1_000_000, 'billion': 1_000_000_000}
+
+
+class CachePolicy(Enum):
+    """Upstream response cache TTLs in seconds, by how quickly a source changes"""
+    SHORT = 30      # DoD contract announcements
+    NORMAL = 300    # SAM.gov opportunity search
+    LONG = 1800     # arXiv listings update daily
+
+
+SOURCE_CACHE_POLICY = {
+    "darpa_news": CachePolicy.NORMAL,
+    "dod_contracts": CachePolicy.SHORT,
+    "arxiv_quantum": CachePolicy.LONG,
+    "arxiv_cs": CachePolicy.LONG,
+}
+STALE_RETENTION_SECONDS = 24 * 3600  # Keep expired responses this long as a fallback when upstream is down
+EVENT_CACHE_TTL_SECONDS = 7 * 24 * 3600  # Per-event Redis entries cover get_all_events' default week
+
+
+class ResponseCache:
+    """Raw upstream response bodies cached in Redis, or in pickle files when Redis is unavailable
+
+    Each entry holds generated_at, stale_at, body and the response's etag/modified
+    validators. Entries outlive their TTL (by STALE_RETENTION_SECONDS) so a stale
+    body can be served when a refetch fails, or revalidated with a conditional GET.
+    Set REDIS_URL to use Redis (pip install redis).
+    """
+
+    def __init__(self, redis_url: Optional[str] = None):
+        self.redis = None
+        self.cache_dir = DARPA_CACHE_DIR / "responses"
+
+        redis_url = redis_url or os.getenv("REDIS_URL")
+        if redis_url:
+            try:
+                import redis
+                self.redis = redis.Redis.from_url(redis_url)
+                self.redis.ping()
+            except Exception as e:
+                logger.warning(f"Redis unavailable, caching DARPA responses on disk: {e}")
+                self.redis = None
+
+        if self.redis is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(source: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Stable cache key for a source's request"""
+        request_repr = f"{url}?{sorted((params or {}).items())}"
+        return f"darpa:{source}:{hashlib.blake2b(request_repr.encode(), digest_size=8).hexdigest()}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for key, fresh or stale, or None"""
+        try:
+            if self.redis is not None:
+                entry = self.redis.hgetall(key)
+                if not entry:
+                    return None
+                return {
+                    'generated_at': float(entry[b'generated_at']),
+                    'stale_at': float(entry[b'stale_at']),
+                    'body': entry[b'body'],
+                    'etag': entry.get(b'etag', b'').decode(),
+                    'modified': entry.get(b'modified', b'').decode()
+                }
+
+            path = self.cache_dir / f"{key.replace(':', '_')}.pkl"
+            if not path.exists():
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Error reading response cache {key}: {e}")
+            return None
+
+    def set(self, key: str, body: bytes, ttl: int, etag: str = '', modified: str = ''):
+        """Store a freshly fetched or revalidated body, fresh for ttl seconds"""
+        now = time.time()
+        entry = {'generated_at': now, 'stale_at': now + ttl, 'body': body, 'etag': etag, 'modified': modified}
+        try:
+            if self.redis is not None:
+                with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.hset(key, mapping=entry)
+                    pipe.expire(key, ttl + STALE_RETENTION_SECONDS)
+                    pipe.execute()
+                return
+
+            path = self.cache_dir / f"{key.replace(':', '_')}.pkl"
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.warning(f"Error writing response cache {key}: {e}")
+
 
 class EventSource(Enum):
     """Sources for DARPA-related events"""
@@ -54,14 +206,19 @@ class SignalType(Enum):
     REGULATORY = "regulatory"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DARPAEvent:
-    """A DARPA-related signal event"""
+    """A DARPA-related signal event
+
+    Immutable and hashable, so events can be deduplicated with sets; the
+    metadata dict is excluded from the hash. companies is normalized to a
+    frozenset so membership checks are O(1).
+    """
     id: str
     title: str
     source: EventSource
     signal_type: SignalType
-    companies: List[str]  # Tickers or company names
+    companies: FrozenSet[str]  # Tickers or company names; lists are converted
     technology_domain: str
     description: str
     url: str
@@ -69,16 +226,221 @@ class DARPAEvent:
     importance: str  # high, medium, low
     financial_impact: Optional[str] = None
     contract_value: Optional[float] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict, hash=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'companies', frozenset(self.companies))
+
+
+IMPORTANCE_CODES = {"low": 0, "medium": 1, "high": 2}
+
+
+def json_default(obj):
+    """orjson fallback: company sets become sorted lists, anything else its str()"""
+    if isinstance(obj, frozenset):
+        return sorted(obj)
+    return str(obj)
+
+
+class EventTable:
+    """Column-oriented view of events sorted newest first, for bulk filtering and aggregation
+
+    Row i of every column describes events[i]; the DARPAEvent objects are kept
+    for presentation.
+    """
+
+    def __init__(self, events: List[DARPAEvent]):
+        self.events = sorted(events, key=lambda e: e.datetime, reverse=True)
+        n = len(self.events)
+        # Negated so the column ascends and searchsorted applies
+        self.neg_timestamps = np.fromiter((-e.datetime.timestamp() for e in self.events), dtype=np.float64, count=n)
+        self.contract_values = np.fromiter((e.contract_value or 0 for e in self.events), dtype=np.float64, count=n)
+        self.importance = np.fromiter((IMPORTANCE_CODES.get(e.importance, 0) for e in self.events), dtype=np.uint8, count=n)
+
+    def since(self, cutoff: datetime) -> int:
+        """Number of leading (newest) rows at or after cutoff"""
+        return int(np.searchsorted(self.neg_timestamps, -cutoff.timestamp(), side='right'))
+
+
+NON_WORD_RE = re.compile(r'\W+')
+
+
+def title_digest(title: str) -> str:
+    """Fallback event id from the title; unlike hash(), stable across interpreter runs"""
+    return hashlib.blake2b(title.encode('utf-8'), digest_size=8).hexdigest()
+
+
+@functools.lru_cache(maxsize=2048)
+def parse_feed_date(date_str: str) -> datetime:
+    """Parse a feed timestamp with dateutil; entries in a batch often share one
+
+    Unparseable strings raise, so the caller's fallback to now is never cached.
+    """
+    from dateutil import parser
+    return parser.parse(date_str, default=datetime.now(timezone.utc))
+
+
+def dedupe_events(events: List[DARPAEvent]) -> List[DARPAEvent]:
+    """Drop events repeated across feeds, keeping first-seen order
+
+    Events are collapsed by id, then by a (signal type, companies, normalized
+    title prefix) signature; among signature duplicates the highest-importance
+    event is kept.
+    """
+    seen_ids = set()
+    slot_by_signature: Dict[Tuple, int] = {}
+    unique: List[DARPAEvent] = []
+
+    for event in events:
+        if event.id in seen_ids:
+            continue
+        seen_ids.add(event.id)
+
+        normalized_title = NON_WORD_RE.sub('', event.title.lower())[:80]
+        signature = (event.signal_type, event.companies, normalized_title)
+
+        slot = slot_by_signature.get(signature)
+        if slot is None:
+            slot_by_signature[signature] = len(unique)
+            unique.append(event)
+        elif IMPORTANCE_CODES.get(event.importance, 0) > IMPORTANCE_CODES.get(unique[slot].importance, 0):
+            unique[slot] = event
+
+    return unique
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _scan_keywords(content, kw_bytes, offsets):
+        """Flag which keywords (kw_bytes[offsets[k]:offsets[k + 1]]) occur in content bytes"""
+        n = len(content)
+        found = np.zeros(len(offsets) - 1, dtype=np.uint8)
+        for k in range(len(offsets) - 1):
+            start = offsets[k]
+            length = offsets[k + 1] - start
+            if length == 0 or length > n:
+                continue
+            first = kw_bytes[start]
+            for i in range(n - length + 1):
+                if content[i] != first:
+                    continue
+                j = 1
+                while j < length and content[i + j] == kw_bytes[start + j]:
+                    j += 1
+                if j == length:
+                    found[k] = 1
+                    break
+        return found
+
+
+def iter_sam_results(body: bytes, limit: int):
+    """Yield up to limit result items from a SAM.gov search response
+
+    With ijson the items are stream-parsed and parsing stops at the limit,
+    so long descriptions past it are never decoded.
+    """
+    if ijson is not None:
+        items = ijson.items(io.BytesIO(body), '_embedded.results.item', use_float=True)
+    else:
+        items = orjson.loads(body).get('_embedded', {}).get('results', [])
+
+    for i, item in enumerate(items):
+        if i >= limit:
+            break
+        yield item
+
+
+def parse_feed(body: bytes, limit: int) -> feedparser.FeedParserDict:
+    """Parse an RSS or Atom feed body into a feedparser-style result with up to limit entries
+
+    lxml reads just the item elements and stops at the limit, skipping
+    feedparser's format sniffing. Without lxml, or on malformed XML,
+    feedparser parses the body instead.
+    """
+    if etree is not None:
+        try:
+            entries = []
+            for _, item in etree.iterparse(io.BytesIO(body), events=("end",), tag=FEED_ITEM_TAGS):
+                entries.append(_feed_entry(item))
+                # Drop parsed items so memory stays bounded on long feeds
+                item.clear()
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
+                if len(entries) >= limit:
+                    break
+            return feedparser.FeedParserDict(entries=entries)
+        except etree.XMLSyntaxError as e:
+            logger.debug(f"lxml could not parse feed, falling back to feedparser: {e}")
+
+    return feedparser.parse(body)
+
+
+def _feed_entry(item) -> feedparser.FeedParserDict:
+    """Map one RSS/Atom item element to the entry fields feedparser would produce"""
+    if item.tag == f"{ATOM_NS}entry":
+        link = next((el.get("href") for el in item.iterfind(f"{ATOM_NS}link")
+                     if el.get("rel", "alternate") == "alternate"), "")
+        fields = {
+            "title": item.findtext(f"{ATOM_NS}title"),
+            "summary": item.findtext(f"{ATOM_NS}summary") or item.findtext(f"{ATOM_NS}content"),
+            "link": link,
+            "published": item.findtext(f"{ATOM_NS}published") or item.findtext(f"{ATOM_NS}updated"),
+            "id": item.findtext(f"{ATOM_NS}id"),
+            "authors": [{"name": name.text} for name in item.iterfind(f"{ATOM_NS}author/{ATOM_NS}name")]
+        }
+    else:
+        ns = RSS1_NS if item.tag == f"{RSS1_NS}item" else ""
+        creator = item.findtext(f"{DC_NS}creator")
+        fields = {
+            "title": item.findtext(f"{ns}title"),
+            "summary": item.findtext(f"{ns}description"),
+            "link": item.findtext(f"{ns}link"),
+            "published": item.findtext("pubDate") or item.findtext(f"{DC_NS}date"),
+            "id": item.findtext("guid") or item.get(f"{RDF_NS}about"),
+            "authors": [{"name": creator}] if creator else None
+        }
+
+    entry = feedparser.FeedParserDict(
+        title=(fields["title"] or "").strip(),
+        summary=(fields["summary"] or "").strip(),
+        link=(fields["link"] or "").strip()
+    )
+    # Optional fields are left out when absent, as feedparser does, so entry.get() defaults apply
+    for key in ("published", "id", "authors"):
+        if fields[key]:
+            entry[key] = fields[key].strip() if isinstance(fields[key], str) else fields[key]
+    return entry
+
+
+class KeywordMatches(NamedTuple):
+    """Tracked terms found in a document, each in tracked_companies / signal_keywords order"""
+    company_tickers: List[str]   # Company name mentioned
+    keyword_tickers: List[str]   # Company research keyword mentioned
+    domains: List[str]           # Signal keyword domain mentioned
 
 
 class DARPAEventsMonitor:
     """Monitors DARPA-style frontier tech signal events"""
 
-    def __init__(self):
-        """Initialize the DARPA events monitor"""
+    def __init__(self, session: Optional[requests.Session] = None):
+        """Initialize the DARPA events monitor
+
+        Args:
+            session: Shared requests session for connection reuse (defaults to plain requests)
+        """
+        self.http = session or requests
+        self.response_cache = ResponseCache()
         self.events_cache: Dict[str, List[DARPAEvent]] = {}
 
+        # Last fetch of every source as a newest-first column table
+        self._table = EventTable([])
+        self._events_fetched_at: Optional[float] = None
+
+        # Ticker -> events index over the last get_all_events result
+        self._by_company: Dict[str, List[DARPAEvent]] = {}
+        self._index_hours_back: Optional[int] = None
+        self._index_built_at = 0.0
+
         # Tracked companies and their domains with research keywords
         self.tracked_companies = {
             # Quantum
@@ -140,195 +502,401 @@ class DARPAEventsMonitor:
             "arxiv_cs": "http://arxiv.org/rss/cs.AI"
         }
 
+        # Lowercased lookups built once, so scans never re-lower the same names per document
+        self._name_to_ticker = {
+            info["name"].lower(): (ticker, info["domain"]) for ticker, info in self.tracked_companies.items()
+        }
+        self._company_keywords = {
+            ticker: [keyword.lower() for keyword in info["keywords"]]
+            for ticker, info in self.tracked_companies.items() if info.get("keywords")
+        }
+        self.signal_keywords = {
+            domain: [keyword.lower() for keyword in keywords] for domain, keywords in self.signal_keywords.items()
+        }
+
+        # One automaton over every company name and keyword scans a document in a single pass;
+        # without pyahocorasick, a numba-compiled scan over a flat keyword table
+        self._automaton = self._build_automaton()
+        self._keyword_table = self._build_keyword_table() if self._automaton is None else None
+
         logger.info("DARPAEventsMonitor initialized")
 
+    def _keyword_patterns(self) -> Dict[str, List[Tuple[str, str]]]:
+        """Map every lowercased tracked term to its (kind, ticker/domain) tags
+
+        A term can belong to several companies/domains, so each maps to a list of tags.
+        """
+        patterns: Dict[str, List[Tuple[str, str]]] = {}
+        for name, (ticker, _) in self._name_to_ticker.items():
+            patterns.setdefault(name, []).append(("company", ticker))
+        for ticker, keywords in self._company_keywords.items():
+            for keyword in keywords:
+                patterns.setdefault(keyword, []).append(("keyword", ticker))
+        for domain, keywords in self.signal_keywords.items():
+            for keyword in keywords:
+                patterns.setdefault(keyword, []).append(("domain", domain))
+        return patterns
+
+    def _build_automaton(self):
+        """Build an Aho-Corasick automaton over all tracked terms, or None without pyahocorasick"""
+        if ahocorasick is None:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for term, tags in self._keyword_patterns().items():
+            automaton.add_word(term, tags)
+        automaton.make_automaton()
+        return automaton
+
+    def _build_keyword_table(self):
+        """Flatten all tracked terms for _scan_keywords, or None without numba
+
+        Returns (UTF-8 bytes of every term concatenated, term start offsets, tags per term).
+        """
+        if njit is None:
+            return None
+
+        patterns = self._keyword_patterns()
+        encoded = [term.encode('utf-8') for term in patterns]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(term) for term in encoded])
+        kw_bytes = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        return kw_bytes, offsets, list(patterns.values())
+
+    def _match_keywords(self, content: str) -> KeywordMatches:
+        """Find tracked company names, company keywords and signal domains in lowercased content"""
+        company_hits, keyword_hits, domain_hits = set(), set(), set()
+
+        if self._automaton is not None or self._keyword_table is not None:
+            if self._automaton is not None:
+                matched_tags = (tags for _, tags in self._automaton.iter(content))
+            else:
+                kw_bytes, offsets, term_tags = self._keyword_table
+                found = _scan_keywords(np.frombuffer(content.encode('utf-8'), dtype=np.uint8), kw_bytes, offsets)
+                matched_tags = (term_tags[i] for i in np.flatnonzero(found))
+
+            for tags in matched_tags:
+                for kind, value in tags:
+                    if kind == "company":
+                        company_hits.add(value)
+                    elif kind == "keyword":
+                        keyword_hits.add(value)
+                    else:
+                        domain_hits.add(value)
+        else:
+            for name, (ticker, _) in self._name_to_ticker.items():
+                if name in content:
+                    company_hits.add(ticker)
+            for ticker, keywords in self._company_keywords.items():
+                if any(keyword in content for keyword in keywords):
+                    keyword_hits.add(ticker)
+            for domain, keywords in self.signal_keywords.items():
+                if any(keyword in content for keyword in keywords):
+                    domain_hits.add(domain)
+
+        return KeywordMatches(
+            company_tickers=[ticker for ticker in self.tracked_companies if ticker in company_hits],
+            keyword_tickers=[ticker for ticker in self.tracked_companies if ticker in keyword_hits],
+            domains=[domain for domain in self.signal_keywords if domain in domain_hits]
+        )
+
     def fetch_darpa_news(self) -> List[DARPAEvent]:
         """Fetch DARPA opportunities from SAM.gov"""
-        events = []
+        try:
+            body = self._cached_fetch("darpa_news", SAM_SEARCH_URL, SAM_SEARCH_PARAMS)
+            return self._parse_sam_results(body)
+        except Exception as e:
+            logger.error(f"Error fetching DARPA news: {e}")
+
+        return []
+
+    def _cached_fetch(self, source: str, url: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """GET url through the response cache, serving a stale body if the fetch fails"""
+        key = self.response_cache.key(source, url, params)
+        entry = self.response_cache.get(key)
+        if entry is not None and entry['stale_at'] > time.time():
+            return entry['body']
 
         try:
-            # Use SAM.gov API for DARPA opportunities
-            import requests
-            url = "https://sam.gov/api/prod/sgs/v1/search/"
-            params = {
-                'index': 'opp',
-                'q': 'DARPA',
-                'page': 0,
-                'sort': '-modifiedDate',
-                'size': 20
-            }
-            response = requests.get(url, params=params, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                if '_embedded' in data and 'results' in data['_embedded']:
-                    logger.info(f"Found {len(data['_embedded']['results'])} SAM.gov results")
-                    for item in data['_embedded']['results'][:20]:
-                        # Extract opportunity details
-                        title = item.get('title', 'No Title')
-                        # SAM.gov uses 'descriptions' as a list
-                        descriptions = item.get('descriptions', [])
-                        description = descriptions[0].get('value', '') if descriptions else ''
-                        content = f"{title} {description}".lower()
-
-                        relevant_companies = []
-                        relevant_domains = []
-
-                        # Check for company mentions
-                        for ticker, info in self.tracked_companies.items():
-                            if info["name"].lower() in content:
-                                relevant_companies.append(ticker)
-                                relevant_domains.append(info["domain"])
-
-                        # Check for keyword matches
-                        for domain, keywords in self.signal_keywords.items():
-                            if any(keyword.lower() in content for keyword in keywords):
-                                relevant_domains.append(domain)
-
-                        # Create event for DARPA opportunities - all items from DARPA search are relevant
-                        # Since we searched for "DARPA", all results are DARPA-related
-                        if True:  # Always create event since these are all DARPA results
-                            # Parse the date - SAM.gov dates might be in different formats
-                            try:
-                                event_date = datetime.fromisoformat(item.get('modifiedDate', '').replace('Z', '+00:00'))
-                            except:
-                                event_date = datetime.now(timezone.utc)
-
-                            event = DARPAEvent(
-                                id=f"darpa_{item.get('_id', hash(title))}",
-                                title=title[:200],
-                                source=EventSource.DARPA_NEWS,
-                                signal_type=SignalType.CONTRACT_AWARD if 'award' in title.lower() else SignalType.FUNDING_ROUND,
-                                companies=relevant_companies,
-                                technology_domain=", ".join(set(relevant_domains)) if relevant_domains else "defense_general",
-                                description=description[:500] if description else "DARPA opportunity",
-                                url=f"https://sam.gov/opp/{item.get('_id', item.get('solicitationNumber', ''))}/view",
-                                datetime=event_date,
-                                importance="high" if 'urgent' in title.lower() or len(relevant_companies) > 0 else "medium",
-                                contract_value=item.get('award', {}).get('amount'),
-                                metadata={
-                                    'source_feed': 'SAM.gov',
-                                    'opportunity_type': item.get('type', ''),
-                                    'naics': item.get('naicsCode', ''),
-                                    'response_deadline': item.get('responseDeadLine', '')
-                                }
-                            )
-                            events.append(event)
+            response = self.http.get(url, params=params, headers=self._validator_headers(entry), timeout=10)
+            return self._store_response(key, source, entry, response)
+        except Exception as e:
+            if entry is None:
+                raise
+            logger.warning(f"Serving stale {source} response after fetch error: {e}")
+            return entry['body']
+
+    async def _acached_fetch(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, source: str,
+                             url: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """Async variant of _cached_fetch; semaphore caps the requests in flight for one fetch_all_sources call"""
+        key = self.response_cache.key(source, url, params)
+        entry = self.response_cache.get(key)
+        if entry is not None and entry['stale_at'] > time.time():
+            return entry['body']
 
+        try:
+            async with semaphore:
+                response = await client.get(url, params=params, headers=self._validator_headers(entry))
+            return self._store_response(key, source, entry, response)
         except Exception as e:
-            logger.error(f"Error fetching DARPA news: {e}")
+            if entry is None:
+                raise
+            logger.warning(f"Serving stale {source} response after fetch error: {e}")
+            return entry['body']
+
+    @staticmethod
+    def _validator_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Conditional GET headers from a cached entry, so unchanged feeds answer 304 with no body"""
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('modified'):
+                headers['If-Modified-Since'] = entry['modified']
+        return headers
+
+    def _store_response(self, key: str, source: str, entry: Optional[Dict[str, Any]], response) -> bytes:
+        """Cache a fetched response and return its body; a 304 re-arms the cached body"""
+        if response.status_code == 304 and entry is not None:
+            body = entry['body']
+        else:
+            response.raise_for_status()
+            body = response.content
+
+        previous = entry or {}
+        self.response_cache.set(
+            key, body, SOURCE_CACHE_POLICY[source].value,
+            etag=response.headers.get('ETag') or previous.get('etag', ''),
+            modified=response.headers.get('Last-Modified') or previous.get('modified', '')
+        )
+        return body
+
+    def _parse_sam_results(self, body: bytes) -> List[DARPAEvent]:
+        """Build events from a raw SAM.gov search response"""
+        events = []
 
+        for item in iter_sam_results(body, SAM_MAX_RESULTS):
+            # Extract opportunity details
+            title = item.get('title', 'No Title')
+            # SAM.gov uses 'descriptions' as a list
+            descriptions = item.get('descriptions', [])
+            description = descriptions[0].get('value', '') if descriptions else ''
+            content = f"{title} {description}".lower()
+
+            matches = self._match_keywords(content)
+
+            # Company mentions, then keyword matches
+            relevant_companies = matches.company_tickers
+            relevant_domains = [self.tracked_companies[ticker]["domain"] for ticker in relevant_companies]
+            relevant_domains.extend(matches.domains)
+
+            # Create event for DARPA opportunities - all items from DARPA search are relevant
+            # Since we searched for "DARPA", all results are DARPA-related
+            if True:  # Always create event since these are all DARPA results
+                # Parse the date - SAM.gov dates might be in different formats
+                try:
+                    event_date = datetime.fromisoformat(item.get('modifiedDate', '').replace('Z', '+00:00'))
+                except:
+                    event_date = datetime.now(timezone.utc)
+
+                event = DARPAEvent(
+                    id=f"darpa_{item.get('_id') or title_digest(title)}",
+                    title=title[:200],
+                    source=EventSource.DARPA_NEWS,
+                    signal_type=SignalType.CONTRACT_AWARD if 'award' in title.lower() else SignalType.FUNDING_ROUND,
+                    companies=relevant_companies,
+                    technology_domain=", ".join(set(relevant_domains)) if relevant_domains else "defense_general",
+                    description=description[:500] if description else "DARPA opportunity",
+                    url=f"https://sam.gov/opp/{item.get('_id', item.get('solicitationNumber', ''))}/view",
+                    datetime=event_date,
+                    importance="high" if 'urgent' in title.lower() or len(relevant_companies) > 0 else "medium",
+                    contract_value=item.get('award', {}).get('amount'),
+                    metadata={
+                        'source_feed': 'SAM.gov',
+                        'opportunity_type': item.get('type', ''),
+                        'naics': item.get('naicsCode', ''),
+                        'response_deadline': item.get('responseDeadLine', '')
+                    }
+                )
+                events.append(event)
+
+        logger.info(f"Parsed {len(events)} SAM.gov results")
         return events
 
     def fetch_dod_contracts(self) -> List[DARPAEvent]:
         """Fetch DoD contract awards"""
-        events = []
-
         try:
             feed_url = self.feeds.get("dod_contracts")
             if not feed_url:
-                return events
-
-            feed = feedparser.parse(feed_url)
-
-            for entry in feed.entries[:20]:
-                content = f"{entry.title} {entry.summary}".lower()
-
-                # Look for contract values
-                contract_value = self._extract_contract_value(content)
-
-                relevant_companies = []
-                for ticker, info in self.tracked_companies.items():
-                    if info["name"].lower() in content:
-                        relevant_companies.append(ticker)
-
-                if relevant_companies or contract_value > 1000000:  # $1M+ contracts
-                    event = DARPAEvent(
-                        id=f"dod_{entry.get('id', hash(entry.title))}",
-                        title=entry.title,
-                        source=EventSource.DOD_CONTRACTS,
-                        signal_type=SignalType.CONTRACT_AWARD,
-                        companies=relevant_companies,
-                        technology_domain=self._identify_domain(content),
-                        description=entry.summary[:500],
-                        url=entry.link,
-                        datetime=self._parse_date(entry.get('published', '')),
-                        importance="high" if contract_value > 10000000 else "medium",
-                        contract_value=contract_value,
-                        financial_impact=f"${contract_value:,.0f}" if contract_value else None
-                    )
-                    events.append(event)
+                return []
+
+            return self._parse_dod_feed(parse_feed(self._cached_fetch("dod_contracts", feed_url), DOD_MAX_ENTRIES))
 
         except Exception as e:
             logger.error(f"Error fetching DoD contracts: {e}")
 
+        return []
+
+    def _parse_dod_feed(self, feed) -> List[DARPAEvent]:
+        """Build contract events from a parsed DoD contracts feed"""
+        events = []
+
+        for entry in feed.entries[:DOD_MAX_ENTRIES]:
+            content = f"{entry.title} {entry.summary}".lower()
+
+            # Look for contract values
+            contract_value = self._extract_contract_value(content)
+
+            matches = self._match_keywords(content)
+            relevant_companies = matches.company_tickers
+
+            if relevant_companies or contract_value > 1000000:  # $1M+ contracts
+                event = DARPAEvent(
+                    id=f"dod_{entry.get('id') or title_digest(entry.title)}",
+                    title=entry.title,
+                    source=EventSource.DOD_CONTRACTS,
+                    signal_type=SignalType.CONTRACT_AWARD,
+                    companies=relevant_companies,
+                    technology_domain=", ".join(matches.domains) if matches.domains else "defense_general",
+                    description=entry.summary[:500],
+                    url=entry.link,
+                    datetime=self._parse_date(entry.get('published', '')),
+                    importance="high" if contract_value > 10000000 else "medium",
+                    contract_value=contract_value,
+                    financial_impact=f"${contract_value:,.0f}" if contract_value else None
+                )
+                events.append(event)
+
         return events
 
     def fetch_arxiv_papers(self) -> List[DARPAEvent]:
         """Fetch relevant research papers from arXiv"""
         events = []
 
-        feeds = ["arxiv_quantum", "arxiv_cs"]
-
-        for feed_name in feeds:
+        for feed_name in ARXIV_FEEDS:
             try:
                 feed_url = self.feeds.get(feed_name)
                 if not feed_url:
                     continue
 
-                feed = feedparser.parse(feed_url)
-
-                for entry in feed.entries[:10]:  # Last 10 papers
-                    # Check for relevant keywords
-                    content = f"{entry.title} {entry.summary}".lower()
-
-                    relevant = False
-                    domains = []
-                    matched_tickers = []
-
-                    # Check against company-specific research keywords
-                    for ticker, info in self.tracked_companies.items():
-                        if 'keywords' in info:
-                            if any(kw.lower() in content for kw in info['keywords']):
-                                matched_tickers.append(ticker)
-                                domains.append(info['domain'])
-                                relevant = True
-
-                    # Also check general domain keywords
-                    for domain, keywords in self.signal_keywords.items():
-                        if any(keyword.lower() in content for keyword in keywords):
-                            relevant = True
-                            if domain not in domains:
-                                domains.append(domain)
-
-                    if relevant:
-                        # Check for author affiliations with tracked companies
-                        affiliated_companies = self._extract_company_affiliations(entry.get('authors', []))
-                        companies = list(set(matched_tickers + affiliated_companies))
-
-                        event = DARPAEvent(
-                            id=f"arxiv_{entry.id.split('/')[-1]}",
-                            title=f"Paper: {entry.title}",
-                            source=EventSource.ARXIV,
-                            signal_type=SignalType.RESEARCH_PUBLICATION,
-                            companies=companies,
-                            technology_domain=", ".join(domains),
-                            description=entry.summary[:300],
-                            url=entry.link,
-                            datetime=self._parse_date(entry.get('published', '')),
-                            importance="medium",
-                            metadata={
-                                'authors': entry.get('authors', []),
-                                'arxiv_category': feed_name
-                            }
-                        )
-                        events.append(event)
+                feed = parse_feed(self._cached_fetch(feed_name, feed_url), ARXIV_MAX_ENTRIES)
+                events.extend(self._parse_arxiv_feed(feed, feed_name))
 
             except Exception as e:
                 logger.error(f"Error fetching arXiv papers: {e}")
 
         return events
 
+    def _parse_arxiv_feed(self, feed, feed_name: str) -> List[DARPAEvent]:
+        """Build research events from a parsed arXiv feed"""
+        events = []
+
+        for entry in feed.entries[:ARXIV_MAX_ENTRIES]:  # Latest papers
+            # Check for relevant keywords
+            content = f"{entry.title} {entry.summary}".lower()
+
+            matches = self._match_keywords(content)
+
+            # Company-specific research keywords, then general domain keywords
+            matched_tickers = matches.keyword_tickers
+            domains = [self.tracked_companies[ticker]['domain'] for ticker in matched_tickers]
+            domains.extend(domain for domain in matches.domains if domain not in domains)
+            relevant = bool(matched_tickers or matches.domains)
+
+            if relevant:
+                # Check for author affiliations with tracked companies
+                affiliated_companies = self._extract_company_affiliations(entry.get('authors', []))
+                companies = list(set(matched_tickers + affiliated_companies))
+
+                event = DARPAEvent(
+                    id=f"arxiv_{entry.id.split('/')[-1]}",
+                    title=f"Paper: {entry.title}",
+                    source=EventSource.ARXIV,
+                    signal_type=SignalType.RESEARCH_PUBLICATION,
+                    companies=companies,
+                    technology_domain=", ".join(domains),
+                    description=entry.summary[:300],
+                    url=entry.link,
+                    datetime=self._parse_date(entry.get('published', '')),
+                    importance="medium",
+                    metadata={
+                        'authors': entry.get('authors', []),
+                        'arxiv_category': feed_name
+                    }
+                )
+                events.append(event)
+
+        return events
+
+    async def _afetch_darpa_news(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore) -> List[DARPAEvent]:
+        """Async variant of fetch_darpa_news"""
+        try:
+            body = await self._acached_fetch(client, semaphore, "darpa_news", SAM_SEARCH_URL, SAM_SEARCH_PARAMS)
+            return self._parse_sam_results(body)
+        except Exception as e:
+            logger.error(f"Error fetching DARPA news: {e}")
+
+        return []
+
+    async def _afetch_feed(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, feed_name: str, limit: int):
+        """Download and parse up to limit entries of one configured feed, or None if it isn't configured"""
+        feed_url = self.feeds.get(feed_name)
+        if not feed_url:
+            return None
+
+        return parse_feed(await self._acached_fetch(client, semaphore, feed_name, feed_url), limit)
+
+    async def _afetch_dod_contracts(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore) -> List[DARPAEvent]:
+        """Async variant of fetch_dod_contracts"""
+        try:
+            feed = await self._afetch_feed(client, semaphore, "dod_contracts", DOD_MAX_ENTRIES)
+            return self._parse_dod_feed(feed) if feed is not None else []
+        except Exception as e:
+            logger.error(f"Error fetching DoD contracts: {e}")
+            return []
+
+    async def _afetch_arxiv(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                            feed_name: str) -> List[DARPAEvent]:
+        """Async variant of fetch_arxiv_papers for a single feed"""
+        try:
+            feed = await self._afetch_feed(client, semaphore, feed_name, ARXIV_MAX_ENTRIES)
+            return self._parse_arxiv_feed(feed, feed_name) if feed is not None else []
+        except Exception as e:
+            logger.error(f"Error fetching arXiv papers: {e}")
+            return []
+
+    async def fetch_all_sources(self) -> List[DARPAEvent]:
+        """Fetch SAM.gov, DoD and every arXiv feed concurrently
+
+        Total latency is the slowest source rather than the sum of all of them, with
+        at most MAX_CONCURRENT_FETCHES requests in flight. Each fetcher logs and
+        swallows its own errors, like the sync versions.
+        """
+        # One keep-alive client and semaphore per call, passed down rather than stored on
+        # the monitor: get_all_events runs each fetch in a fresh event loop (possibly on
+        # several threads at once), and both are bound to the loop they're used on
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        async with httpx.AsyncClient(
+            timeout=10,
+            follow_redirects=True,
+            limits=httpx.Limits(**ASYNC_CLIENT_LIMITS),
+            headers={'User-Agent': USER_AGENT}
+        ) as client:
+            results = await asyncio.gather(
+                self._afetch_darpa_news(client, semaphore),
+                self._afetch_dod_contracts(client, semaphore),
+                *(self._afetch_arxiv(client, semaphore, feed_name) for feed_name in ARXIV_FEEDS),
+                return_exceptions=True
+            )
+
+        all_events = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching DARPA source: {result}")
+            else:
+                all_events.extend(result)
+        return all_events
+
     def search_patents(self, companies: List[str]) -> List[DARPAEvent]:
         """Search for recent patent filings (placeholder for USPTO API)"""
         events = []
@@ -353,27 +921,61 @@ class DARPAEventsMonitor:
         return events
 
     def get_all_events(self, hours_back: int = 168) -> List[DARPAEvent]:
-        """Get all DARPA events from various sources"""
-        all_events = []
+        """Get all DARPA events from various sources, newest first
 
-        # Fetch from all sources
-        all_events.extend(self.fetch_darpa_news())
-        all_events.extend(self.fetch_dod_contracts())
-        all_events.extend(self.fetch_arxiv_papers())
+        Fetched events are kept as a sorted EventTable for CachePolicy.SHORT seconds,
+        so calls with different windows reuse one fetch and the cutoff is a binary search.
+        """
+        fetched_at = self._events_fetched_at
+        if fetched_at is None or time.monotonic() - fetched_at >= CachePolicy.SHORT.value:
+            self._refresh_events()
 
-        # Filter by time
+        # Newest first, so everything at or after the cutoff is a prefix
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours_back)
-        filtered = [e for e in all_events if e.datetime >= cutoff]
-
-        # Sort by datetime
-        filtered.sort(key=lambda x: x.datetime, reverse=True)
+        filtered = self._table.events[:self._table.since(cutoff)]
 
+        self._index_by_company(filtered, hours_back)
         return filtered
 
-    def get_company_events(self, ticker: str) -> List[DARPAEvent]:
-        """Get events for a specific company"""
-        all_events = self.get_all_events()
-        return [e for e in all_events if ticker in e.companies]
+    def _refresh_events(self):
+        """Fetch from all sources and store the events as a sorted EventTable"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            all_events = asyncio.run(self.fetch_all_sources())
+        else:
+            # Already inside an event loop, where asyncio.run can't be used - fetch serially
+            all_events = self.fetch_darpa_news() + self.fetch_dod_contracts() + self.fetch_arxiv_papers()
+
+        deduped = dedupe_events(all_events)
+        if len(deduped) < len(all_events):
+            logger.info(f"Dropped {len(all_events) - len(deduped)} duplicate DARPA events")
+
+        self._table = EventTable(deduped)
+        self._events_fetched_at = time.monotonic()
+
+    def _index_by_company(self, events: List[DARPAEvent], hours_back: int):
+        """Rebuild the ticker -> events index for a freshly fetched event list"""
+        by_company = defaultdict(list)
+        for event in events:
+            for company in event.companies:
+                by_company[company].append(event)
+
+        self._by_company = by_company
+        self._index_hours_back = hours_back
+        self._index_built_at = time.monotonic()
+
+    def get_company_events(self, ticker: str, hours_back: int = 168) -> List[DARPAEvent]:
+        """Get events for a specific company
+
+        Served from the index of the last get_all_events call; it is refreshed when
+        built for another window or older than the shortest response cache TTL.
+        """
+        index_age = time.monotonic() - self._index_built_at
+        if self._index_hours_back != hours_back or index_age >= CachePolicy.SHORT.value:
+            self.get_all_events(hours_back)
+
+        return self._by_company.get(ticker, [])
 
     def _classify_signal_type(self, title: str) -> SignalType:
         """Classify the signal type based on title"""
@@ -408,31 +1010,13 @@ class DARPAEventsMonitor:
     def _extract_contract_value(self, text: str) -> float:
         """Extract contract value from text"""
         # Look for dollar amounts
-        pattern = r'\$([0-9,]+(?:\.[0-9]+)?)\s*(?:million|billion)?'
-        match = re.search(pattern, text, re.IGNORECASE)
-
-        if match:
-            value_str = match.group(1).replace(',', '')
-            value = float(value_str)
-
-            if "billion" in text.lower():
-                value *= 1_000_000_000
-            elif "million" in text.lower():
-                value *= 1_000_000
+        match = CONTRACT_VALUE_RE.search(text)
+        if not match:
+            return 0
 
-            return value
-
-        return 0
-
-    def _identify_domain(self, text: str) -> str:
-        """Identify technology domain from text"""
-        domains = []
-
-        for domain, keywords in self.signal_keywords.items():
-            if any(keyword.lower() in text for keyword in keywords):
-                domains.append(domain)
-
-        return ", ".join(domains) if domains else "defense_general"
+        value = float(match.group(1).replace(',', ''))
+        unit = (match.group(2) or '').lower()
+        return value * CONTRACT_VALUE_UNITS.get(unit, 1)
 
     def _extract_company_affiliations(self, authors: List) -> List[str]:
         """Extract company affiliations from author list"""
@@ -445,17 +1029,14 @@ class DARPAEventsMonitor:
             else:
                 affiliation = str(author)
 
-            for ticker, info in self.tracked_companies.items():
-                if info["name"].lower() in affiliation.lower():
-                    companies.append(ticker)
+            companies.extend(self._match_keywords(affiliation.lower()).company_tickers)
 
         return companies
 
     def _parse_date(self, date_str: str) -> datetime:
         """Parse date string to datetime"""
         try:
-            from dateutil import parser
-            return parser.parse(date_str, default=datetime.now(timezone.utc))
+            return parse_feed_date(date_str)
         except:
             return datetime.now(timezone.utc)
 
@@ -463,64 +1044,78 @@ class DARPAEventsMonitor:
         """Generate summary of important events"""
         events = self.get_all_events(hours_back=24)  # Last 24 hours
 
-        high_importance = [e for e in events if e.importance == "high"]
-        by_company = {}
+        # Numeric aggregates come from the table columns; events is their leading slice
+        table = self._table
+        rows = len(events)
+        high_rows = np.flatnonzero(table.importance[:rows] == IMPORTANCE_CODES["high"])
+        high_importance = [table.events[i] for i in high_rows[:5]]
+        total_contract_value = float(table.contract_values[:rows].sum())
 
+        # Set-like aggregates in one pass over the events
+        companies_affected = set()
+        by_domain = defaultdict(int)
         for event in events:
-            for company in event.companies:
-                if company not in by_company:
-                    by_company[company] = []
-                by_company[company].append(event)
-
-        total_contract_value = sum(e.contract_value for e in events if e.contract_value)
+            companies_affected |= event.companies
+            by_domain[event.technology_domain] += 1
 
         return {
             'total_events': len(events),
-            'high_importance_count': len(high_importance),
-            'companies_affected': list(by_company.keys()),
+            'high_importance_count': len(high_rows),
+            'companies_affected': sorted(companies_affected),
             'total_contract_value': total_contract_value,
             'top_events': [
                 {
                     'title': e.title,
-                    'companies': e.companies,
+                    'companies': sorted(e.companies),
                     'importance': e.importance,
                     'type': e.signal_type.value
                 }
-                for e in high_importance[:5]
+                for e in high_importance
             ],
-            'by_domain': self._group_by_domain(events)
+            'by_domain': dict(by_domain)
         }
 
-    def _group_by_domain(self, events: List[DARPAEvent]) -> Dict[str, int]:
-        """Group events by technology domain"""
-        domains = {}
-        for event in events:
-            domain = event.technology_domain
-            domains[domain] = domains.get(domain, 0) + 1
-        return domains
-
     def save_to_cache(self, events: List[DARPAEvent]):
         """Save events to cache"""
         cache_file = DARPA_CACHE_DIR / f"events_{datetime.now().strftime('%Y%m%d')}.json"
 
+        # orjson serializes the dataclasses directly: enums as their values, datetimes as ISO 8601,
+        # company sets via json_default
         data = {
-            'updated_at': datetime.now(timezone.utc).isoformat(),
-            'events': [
-                {
-                    **asdict(event),
-                    'datetime': event.datetime.isoformat(),
-                    'source': event.source.value,
-                    'signal_type': event.signal_type.value
-                }
-                for event in events
-            ]
+            'updated_at': datetime.now(timezone.utc),
+            'events': events
         }
+        cache_file.write_bytes(orjson.dumps(data, default=json_default))
 
-        with open(cache_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        if self.response_cache.redis is not None:
+            self._save_events_to_redis(events)
 
         logger.info(f"Saved {len(events)} DARPA events to cache")
 
+    def _save_events_to_redis(self, events: List[DARPAEvent]):
+        """Store each event as darpa:event:<id>, indexed by darpa:company:<ticker> sets
+
+        All writes go through one non-transactional pipeline: a single round trip
+        instead of several per event.
+        """
+        try:
+            with self.response_cache.redis.pipeline(transaction=False) as pipe:
+                for event in events:
+                    key = f"darpa:event:{event.id}"
+                    pipe.hset(key, mapping={
+                        'timestamp': event.datetime.timestamp(),
+                        'importance': event.importance,
+                        'data': orjson.dumps(event, default=json_default)
+                    })
+                    pipe.expire(key, EVENT_CACHE_TTL_SECONDS)
+                    for ticker in event.companies:
+                        index_key = f"darpa:company:{ticker}"
+                        pipe.sadd(index_key, event.id)
+                        pipe.expire(index_key, EVENT_CACHE_TTL_SECONDS)
+                pipe.execute()
+        except Exception as e:
+            logger.warning(f"Error writing DARPA events to Redis: {e}")
+
 
 def main():
     """Test the DARPA events monitor"""
@@ -537,7 +1132,7 @@ def main():
     for event in events[:5]:
         print(f"\n{event.datetime.strftime('%Y-%m-%d')} - {event.title}")
         print(f"  Type: {event.signal_type.value}")
-        print(f"  Companies: {', '.join(event.companies) if event.companies else 'None'}")
+        print(f"  Companies: {', '.join(sorted(event.companies)) if event.companies else 'None'}")
         print(f"  Domain: {event.technology_domain}")
         print(f"  Importance: {event.importance}")
         if event.contract_value:
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Fused technical indicator kernel for get_signals
+Computes EMA9, SMA10, MACD(12/26/9), RSI14, Bollinger Bands(20, 2) and VWAP
+in one pass over the bar arrays, matching pandas_ta's default definitions
+"""
+
+import numpy as np
+
+try:
+    from numba import njit  # Optional: pip install numba - get_signals falls back to pandas_ta
+except ImportError:
+    njit = None
+
+EMA_LENGTH = 9
+SMA_LENGTH = 10
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+RSI_LENGTH = 14
+BB_LENGTH = 20
+BB_STD = 2.0
+ATR_LENGTH = 14
+
+# Output arrays of compute_all, in argument order
+INDICATOR_COLUMNS = (
+    "ema9", "ma10", "macd", "signal", "hist", "rsi",
+    "bb_upper", "bb_middle", "bb_lower", "vwap"
+)
+
+def _compute_all(close, high, low, vol, out_ema9, out_ma10, out_macd, out_sig, out_hist,
+                 out_rsi, out_bbu, out_bbm, out_bbl, out_vwap):
+    """Fill the out_* float64 arrays from close/high/low/volume; warm-up bars are NaN
+
+    EMAs are seeded with the SMA of their first `length` values (pandas_ta's
+    sma=True), the MACD signal line from the first valid MACD values. RSI uses
+    Wilder smoothing as an adjusted EWM, like pandas_ta's rma. Band width uses
+    the population standard deviation (ddof=0) kept with a sliding Welford update.
+    """
+    n = close.shape[0]
+    a_ema = 2.0 / (EMA_LENGTH + 1)
+    a_fast = 2.0 / (MACD_FAST + 1)
+    a_slow = 2.0 / (MACD_SLOW + 1)
+    a_sig = 2.0 / (MACD_SIGNAL + 1)
+    rsi_decay = 1.0 - 1.0 / RSI_LENGTH
+    macd_start = MACD_SLOW - 1
+    sig_start = macd_start + MACD_SIGNAL - 1
+
+    prefix = 0.0  # Sum of closes so far, for the EMA seeds
+    ema = 0.0
+    fast = 0.0
+    slow = 0.0
+    sig = 0.0
+    macd_sum = 0.0
+    sma_sum = 0.0
+    bb_mean = 0.0
+    bb_m2 = 0.0
+    gain = 0.0
+    loss = 0.0
+    cum_pv = 0.0
+    cum_v = 0.0
+
+    for i in range(n):
+        x = close[i]
+        prefix += x
+
+        # EMA9
+        if i < EMA_LENGTH - 1:
+            out_ema9[i] = np.nan
+        else:
+            ema = prefix / EMA_LENGTH if i == EMA_LENGTH - 1 else a_ema * x + (1.0 - a_ema) * ema
+            out_ema9[i] = ema
+
+        # SMA10
+        sma_sum += x
+        if i >= SMA_LENGTH:
+            sma_sum -= close[i - SMA_LENGTH]
+        out_ma10[i] = sma_sum / SMA_LENGTH if i >= SMA_LENGTH - 1 else np.nan
+
+        # MACD: fast/slow EMAs, then an EMA of their difference
+        if i == MACD_FAST - 1:
+            fast = prefix / MACD_FAST
+        elif i >= MACD_FAST:
+            fast = a_fast * x + (1.0 - a_fast) * fast
+        if i < macd_start:
+            out_macd[i] = np.nan
+            out_sig[i] = np.nan
+            out_hist[i] = np.nan
+        else:
+            slow = prefix / MACD_SLOW if i == macd_start else a_slow * x + (1.0 - a_slow) * slow
+            m = fast - slow
+            out_macd[i] = m
+            if i < sig_start:
+                macd_sum += m
+                out_sig[i] = np.nan
+                out_hist[i] = np.nan
+            else:
+                sig = (macd_sum + m) / MACD_SIGNAL if i == sig_start else a_sig * m + (1.0 - a_sig) * sig
+                out_sig[i] = sig
+                out_hist[i] = m - sig
+
+        # RSI14
+        if i == 0:
+            out_rsi[i] = np.nan
+        else:
+            d = x - close[i - 1]
+            gain = (d if d > 0.0 else 0.0) + rsi_decay * gain
+            loss = (-d if d < 0.0 else 0.0) + rsi_decay * loss
+            total = gain + loss
+            out_rsi[i] = 100.0 * gain / total if i >= RSI_LENGTH and total > 0.0 else np.nan
+
+        # Bollinger Bands
+        if i < BB_LENGTH:
+            delta = x - bb_mean
+            bb_mean += delta / (i + 1)
+            bb_m2 += delta * (x - bb_mean)
+        else:
+            old = close[i - BB_LENGTH]
+            prev_mean = bb_mean
+            bb_mean += (x - old) / BB_LENGTH
+            bb_m2 += (x - old) * (x - bb_mean + old - prev_mean)
+        if i < BB_LENGTH - 1:
+            out_bbu[i] = np.nan
+            out_bbm[i] = np.nan
+            out_bbl[i] = np.nan
+        else:
+            band = BB_STD * np.sqrt(max(bb_m2, 0.0) / BB_LENGTH)
+            out_bbu[i] = bb_mean + band
+            out_bbm[i] = bb_mean
+            out_bbl[i] = bb_mean - band
+
+        # VWAP
+        cum_pv += (high[i] + low[i] + x) / 3.0 * vol[i]
+        cum_v += vol[i]
+        out_vwap[i] = cum_pv / cum_v if cum_v != 0.0 else np.nan
+
+def atr_last(high, low, close, length: int = ATR_LENGTH) -> float:
+    """Mean true range over the last `length` bars (NaN if fewer bars or a missing high/low)
+
+    Only the final value is needed for the risk anchor, so just the trailing
+    window is sliced instead of building a full true range series. The first
+    bar of the data has no previous close, so its true range is high - low.
+    """
+    if close.shape[0] < length:
+        return np.nan
+    high = high[-length:]
+    low = low[-length:]
+    prev_close = close[-length - 1:-1] if close.shape[0] > length else np.concatenate(([np.nan], close[:length - 1]))
+    # fmax skips a NaN operand, like DataFrame.max(axis=1)
+    true_range = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+    return float(true_range.mean())
+
+if njit is not None:
+    # nogil lets watchlist threads compute different symbols at the same time
+    compute_all = njit(cache=True, nogil=True)(_compute_all)
+
+    # Compile (or load from the on-disk cache) at import instead of on the first request
+    _warm = np.linspace(100.0, 110.0, 40)
+    compute_all(_warm, _warm + 1.0, _warm - 1.0, np.ones(40), *(np.empty(40) for _ in INDICATOR_COLUMNS))
+    del _warm
+else:
+    compute_all = None
@@ -4,17 +4,45 @@ Macro Events Tracker for Trading System
 Monitors Fed speeches, FOMC meetings, economic data releases, and geopolitical events
 """
 
+import io
 import os
-import json
+import mmap
+import re
+import functools
+import time
+import pickle
+import hashlib
 import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
+import orjson
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict, field
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
+from zoneinfo import ZoneInfo
+import numpy as np
 import pandas as pd
 import asyncio
-from enum import Enum
+from enum import Enum, IntEnum
+
+try:
+    import ahocorasick  # Optional: pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from numba import njit  # Optional: compiled importance counting for large event replays
+except ImportError:
+    njit = None
+
+try:
+    import ijson  # Optional: stream-parse the Fed calendar one event at a time
+except ImportError:
+    ijson = None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -25,13 +53,37 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent.absolute()
 EVENTS_CACHE_DIR = PROJECT_ROOT / "data" / "events"
 EVENTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+UTC = timezone.utc
+FETCH_TIMEOUT = 10
+EVENTS_CACHE_MAX_AGE = 3600  # Seconds a saved events file stays usable
+JIT_MIN_EVENTS = 100  # Below this, compiling/array setup costs more than the Python loop
+
+# US equity session boundaries, as minutes after midnight Eastern (DST-aware via zoneinfo)
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN_MINUTE = 9 * 60 + 30
+MARKET_CLOSE_MINUTE = 16 * 60
+
+# Fed calendar HTTP cache: validators, body digest and parsed events, kept across runs
+FED_HTTP_CACHE_FILE = EVENTS_CACHE_DIR / "http" / "fed_calendar.pkl"
+FED_CALENDAR_TTL = 300  # Seconds a fetched calendar is served without contacting the Fed
+
+# Fed event title patterns, matched case-insensitively in one C-level scan each
+FED_CRITICAL_RE = re.compile(r'fomc|federal open market|rate decision', re.IGNORECASE)
+FED_HIGH_RE = re.compile(r'powell|chair|testimony|semiannual', re.IGNORECASE)
+POWELL_RE = re.compile(r'powell', re.IGNORECASE)
+
+
+class EventImportance(IntEnum):
+    """Event importance levels, ordered so they compare directly"""
+    CRITICAL = 3  # Fed meetings, major geopolitical events
+    HIGH = 2      # Fed speeches, CPI/NFP releases
+    MEDIUM = 1    # Other economic data
+    LOW = 0       # Minor events
 
-class EventImportance(Enum):
-    """Event importance levels"""
-    CRITICAL = "critical"  # Fed meetings, major geopolitical events
-    HIGH = "high"         # Fed speeches, CPI/NFP releases
-    MEDIUM = "medium"     # Other economic data
-    LOW = "low"           # Minor events
+    @property
+    def label(self) -> str:
+        """Lowercase name for display and API output, e.g. 'high'"""
+        return self.name.lower()
 
 
 class EventCategory(Enum):
@@ -44,9 +96,13 @@ class EventCategory(Enum):
     MARKET_HOURS = "market_hours"  # Market open/close, holidays
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class MacroEvent:
-    """Structured macro event"""
+    """Structured macro event
+
+    Slotted (no per-instance __dict__) and keyword-only, so the optional
+    fields don't constrain field order.
+    """
     id: str
     title: str
     category: EventCategory
@@ -64,13 +120,84 @@ class MacroEvent:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# Feed date/time strings repeat across events and runs. These are module-level
+# so lru_cache doesn't hold a reference to the tracker.
+@functools.lru_cache(maxsize=4096)
+def parse_fed_time(time_str: str) -> Tuple[int, int]:
+    """Parse Fed time format (e.g., '2:30 p.m.' -> (14, 30))"""
+    try:
+        time_str = time_str.strip().lower()
+
+        # Remove periods
+        time_str = time_str.replace('.', '')
+
+        # Parse time parts
+        is_pm = 'pm' in time_str or 'p.m' in time_str
+        is_am = 'am' in time_str or 'a.m' in time_str
+
+        # Remove am/pm indicators
+        time_str = time_str.replace('pm', '').replace('p.m', '')
+        time_str = time_str.replace('am', '').replace('a.m', '')
+        time_str = time_str.strip()
+
+        # Split hours and minutes
+        if ':' in time_str:
+            parts = time_str.split(':')
+            hours = int(parts[0])
+            minutes = int(parts[1]) if len(parts) > 1 else 0
+        else:
+            hours = int(time_str)
+            minutes = 0
+
+        # Convert to 24-hour format
+        if is_pm and hours != 12:
+            hours += 12
+        elif is_am and hours == 12:
+            hours = 0
+
+        return hours, minutes
+
+    except Exception as e:
+        logger.warning(f"Could not parse time: {time_str} - {e}")
+        return 12, 0  # Default to noon
+
+
+def title_digest(title: str) -> str:
+    """Event id suffix from the title; unlike hash(), stable across interpreter runs"""
+    return hashlib.blake2b(title.encode('utf-8'), digest_size=8).hexdigest()
+
+
+if njit is not None:
+    @njit(cache=True)
+    def count_impact_levels(levels):
+        """Count CRITICAL (3) and HIGH (2) entries in an int8 array of EventImportance values"""
+        critical = 0
+        high = 0
+        for level in levels:
+            if level == 3:
+                critical += 1
+            elif level == 2:
+                high += 1
+        return critical, high
+else:
+    count_impact_levels = None
+
+
 class MacroEventsTracker:
     """Tracks macroeconomic events and their market impact"""
 
-    def __init__(self):
-        """Initialize the macro events tracker"""
+    def __init__(self, session: Optional[requests.Session] = None):
+        """Initialize the macro events tracker
+
+        Args:
+            session: Shared requests session for connection reuse (defaults to a pooled session of its own)
+        """
+        self.http = session or self._make_session()
         self.events_cache: Dict[str, List[MacroEvent]] = {}
         self.fed_calendar_url = "https://www.federalreserve.gov/json/calendar.json"
+        self._fed_http_cache = self._load_fed_http_cache()
+        # Single-flight: one Fed fetch at a time; callers that waited then find it fresh
+        self._fed_lock = threading.Lock()
 
         # Common headers for web requests
         self.headers = {
@@ -91,9 +218,24 @@ class MacroEventsTracker:
             "Jefferson", "Kashkari", "Kugler", "Logan", "Musalem", "Schmid",
             "Waller", "Williams"
         ]
+        self._official_names = {official.lower(): official for official in self.fed_officials}
+        self._official_re = re.compile(
+            r'\b(' + '|'.join(map(re.escape, self.fed_officials)) + r')\b', re.IGNORECASE
+        )
+        # With pyahocorasick, speaker scans use one automaton over all officials instead of the regex
+        self._official_automaton = self._build_official_automaton()
 
         logger.info("MacroEventsTracker initialized")
 
+    @staticmethod
+    def _make_session() -> requests.Session:
+        """Standalone session: keep-alive connections to the Fed plus retries with backoff"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.3))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
     def fetch_fed_calendar(self) -> List[MacroEvent]:
         """
         Fetch Federal Reserve calendar events
@@ -101,43 +243,159 @@ class MacroEventsTracker:
         Returns:
             List of Fed events
         """
-        events = []
+        cached = self._fresh_fed_events()
+        if cached is not None:
+            return cached
+
+        with self._fed_lock:
+            # Another caller may have refreshed the calendar while we waited
+            cached = self._fresh_fed_events()
+            if cached is not None:
+                return cached
+
+            try:
+                logger.info("Fetching Federal Reserve calendar...")
+                response = self.http.get(
+                    self.fed_calendar_url,
+                    headers={**self.headers, **self._fed_validator_headers()},
+                    timeout=FETCH_TIMEOUT
+                )
+                return self._fed_events_from_response(response)
+
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Error fetching Fed calendar: {e}")
+            except Exception as e:
+                logger.error(f"Unexpected error fetching Fed calendar: {e}")
+
+        return []
+
+    async def _afetch_fed_calendar(self, client: httpx.AsyncClient) -> List[MacroEvent]:
+        """Async variant of fetch_fed_calendar"""
+        cached = self._fresh_fed_events()
+        if cached is not None:
+            return cached
+
+        # A fetch is already in flight on another thread: wait for it off the event loop
+        if not self._fed_lock.acquire(blocking=False):
+            return await asyncio.to_thread(self.fetch_fed_calendar)
 
         try:
+            cached = self._fresh_fed_events()
+            if cached is not None:
+                return cached
+
             logger.info("Fetching Federal Reserve calendar...")
-            response = requests.get(self.fed_calendar_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            response = await client.get(self.fed_calendar_url, headers=self._fed_validator_headers())
+            return self._fed_events_from_response(response)
 
-            # Handle potential BOM in response
-            text = response.text
-            if text.startswith('\ufeff'):
-                text = text[1:]
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching Fed calendar: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error fetching Fed calendar: {e}")
+        finally:
+            self._fed_lock.release()
+
+        return []
+
+    def _fresh_fed_events(self) -> Optional[List[MacroEvent]]:
+        """Cached Fed events if they were fetched within FED_CALENDAR_TTL, else None"""
+        entry = self._fed_http_cache
+        if entry is not None and time.time() - entry['fetched_at'] < FED_CALENDAR_TTL:
+            return entry['events']
+        return None
+
+    def _fed_validator_headers(self) -> Dict[str, str]:
+        """Conditional GET headers from the cached calendar, so an unchanged one answers 304"""
+        headers = {}
+        entry = self._fed_http_cache
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('modified'):
+                headers['If-Modified-Since'] = entry['modified']
+        return headers
+
+    def _fed_events_from_response(self, response) -> List[MacroEvent]:
+        """Parse a Fed calendar response (requests or httpx), reusing cached events when unchanged
+
+        A 304, or a 200 whose body digest matches the cached one, skips parsing.
+        """
+        entry = self._fed_http_cache
+        if response.status_code == 304 and entry is not None:
+            events = entry['events']
+            digest = entry['digest']
+        else:
+            response.raise_for_status()
+            body = response.content
+            digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+            if entry is not None and entry['digest'] == digest:
+                events = entry['events']
+            else:
+                events = self._parse_fed_calendar(body)
+
+        previous = entry or {}
+        self._fed_http_cache = {
+            'fetched_at': time.time(),
+            'etag': response.headers.get('ETag') or previous.get('etag', ''),
+            'modified': response.headers.get('Last-Modified') or previous.get('modified', ''),
+            'digest': digest,
+            'events': events
+        }
+        self._save_fed_http_cache()
+        return events
 
-            data = json.loads(text)
-            fed_events = data.get('events', [])
+    def _load_fed_http_cache(self) -> Optional[Dict[str, Any]]:
+        """Load the Fed calendar HTTP cache from disk, or None"""
+        try:
+            with open(FED_HTTP_CACHE_FILE, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable Fed calendar cache: {e}")
+            return None
 
-            logger.info(f"Fed calendar returned {len(fed_events)} events")
+    def _save_fed_http_cache(self):
+        """Write the Fed calendar HTTP cache atomically"""
+        try:
+            FED_HTTP_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = FED_HTTP_CACHE_FILE.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(self._fed_http_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(FED_HTTP_CACHE_FILE)
+        except Exception as e:
+            logger.warning(f"Error writing Fed calendar cache: {e}")
 
-            # Debug: log first event if available
-            if fed_events and len(fed_events) > 0:
-                logger.debug(f"Sample event: {fed_events[0]}")
+    def _parse_fed_calendar(self, body: bytes) -> List[MacroEvent]:
+        """Build events from the raw Fed calendar JSON"""
+        events = []
 
-            for event_data in fed_events:
-                try:
-                    # Parse Fed event
-                    event = self._parse_fed_event(event_data)
-                    if event:
-                        events.append(event)
-                except Exception as e:
-                    logger.error(f"Error parsing Fed event: {e}")
+        # Handle potential BOM in response; orjson parses the UTF-8 bytes without a decode pass
+        if body[:3] == b'\xef\xbb\xbf':
+            body = body[3:]
 
-            logger.info(f"Fetched {len(events)} Fed events")
+        # With ijson only one raw event dict is alive at a time
+        if ijson is not None:
+            fed_events = ijson.items(io.BytesIO(body), 'events.item', use_float=True)
+        else:
+            fed_events = orjson.loads(body).get('events', [])
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching Fed calendar: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error fetching Fed calendar: {e}")
+        count = 0
+        for count, event_data in enumerate(fed_events, 1):
+            # Debug: log first event if available
+            if count == 1:
+                logger.debug(f"Sample event: {event_data}")
 
+            try:
+                # Parse Fed event
+                event = self._parse_fed_event(event_data)
+                if event:
+                    events.append(event)
+            except Exception as e:
+                logger.error(f"Error parsing Fed event: {e}")
+
+        logger.info(f"Fed calendar returned {count} events")
+        logger.info(f"Fetched {len(events)} Fed events")
         return events
 
     def _parse_fed_event(self, event_data: Dict) -> Optional[MacroEvent]:
@@ -161,14 +419,11 @@ class MacroEventsTracker:
                     logger.debug(f"Skipping event with old date format: {month_str}")
                     return None
 
-                # Combine into datetime string
-                datetime_str = f"{month_str}-{day.zfill(2)}"
-                if time_str:
-                    # Clean time (e.g., "2:30 p.m." -> "14:30")
-                    time_str = self._parse_fed_time(time_str)
-                    datetime_str = f"{datetime_str} {time_str}"
-
-                event_datetime = self._parse_datetime(datetime_str)
+                # Build the datetime from its parts - no format guessing needed
+                year, month = month_str.split('-')[:2]
+                # Clean time (e.g., "2:30 p.m." -> 14:30); midnight when there is none
+                hours, minutes = parse_fed_time(time_str) if time_str else (0, 0)
+                event_datetime = datetime(int(year), int(month), int(day), hours, minutes, tzinfo=UTC)
             else:
                 return None
 
@@ -180,7 +435,7 @@ class MacroEventsTracker:
 
             # Create event
             event = MacroEvent(
-                id=f"fed_{event_datetime.strftime('%Y%m%d_%H%M')}_{hash(title) % 1000}",
+                id=f"fed_{event_datetime.strftime('%Y%m%d_%H%M')}_{title_digest(title)}",
                 title=title,
                 category=EventCategory.FED,
                 importance=importance,
@@ -207,21 +462,14 @@ class MacroEventsTracker:
 
     def _determine_fed_importance(self, title: str) -> EventImportance:
         """Determine importance of Fed event"""
-        title_lower = title.lower()
-
         # Critical events
-        if any(keyword in title_lower for keyword in ["fomc", "federal open market", "rate decision"]):
+        if FED_CRITICAL_RE.search(title):
             return EventImportance.CRITICAL
 
-        # High importance
-        if any(keyword in title_lower for keyword in ["powell", "chair", "testimony", "semiannual"]):
+        # High importance, including Powell; other Fed officials' events are medium
+        if FED_HIGH_RE.search(title):
             return EventImportance.HIGH
 
-        # Check for other Fed officials
-        for official in self.fed_officials:
-            if official.lower() in title_lower:
-                return EventImportance.HIGH if "powell" in official.lower() else EventImportance.MEDIUM
-
         return EventImportance.MEDIUM
 
     def _assess_fed_impact(self, title: str, importance: EventImportance) -> str:
@@ -229,31 +477,49 @@ class MacroEventsTracker:
         if importance == EventImportance.CRITICAL:
             return "Major volatility expected across all markets"
         elif importance == EventImportance.HIGH:
-            if "powell" in title.lower():
+            if POWELL_RE.search(title):
                 return "High volatility expected in bonds and equities"
             return "Moderate volatility expected, watch for policy hints"
         else:
             return "Limited immediate impact, monitor for policy signals"
 
     def _extract_speakers(self, title: str, description: str) -> List[str]:
-        """Extract speaker names from event text"""
-        speakers = []
-        text = f"{title} {description}".lower()
-
-        for official in self.fed_officials:
-            if official.lower() in text:
-                speakers.append(official)
+        """Extract speaker names from event text, in order of first mention"""
+        text = f"{title} {description}"
+        if self._official_automaton is None:
+            matches = self._official_re.findall(text)
+            return list(dict.fromkeys(self._official_names[match.lower()] for match in matches))
+
+        text = text.lower()
+        speakers = {}  # Insertion-ordered set
+        for end, (official, length) in self._official_automaton.iter(text):
+            start = end - length + 1
+            # Whole words only, like the regex's \b anchors
+            if (start == 0 or not text[start - 1].isalnum()) and (end + 1 == len(text) or not text[end + 1].isalnum()):
+                speakers[official] = None
+        return list(speakers)
+
+    def _build_official_automaton(self):
+        """Aho-Corasick automaton over lowercased official names, or None without pyahocorasick"""
+        if ahocorasick is None:
+            return None
 
-        return speakers
+        automaton = ahocorasick.Automaton()
+        for name, official in self._official_names.items():
+            automaton.add_word(name, (official, len(name)))
+        automaton.make_automaton()
+        return automaton
 
-    def fetch_economic_calendar(self, days_ahead: int = 7) -> List[MacroEvent]:
+    def fetch_economic_calendar(self, days_ahead: int = 7, cutoff: Optional[datetime] = None) -> Iterator[MacroEvent]:
         """
-        Fetch economic calendar events
+        Yield economic calendar events, skipping any scheduled after cutoff
 
         Note: This is a placeholder for integration with economic calendar APIs
         like TradingEconomics, Investing.com, or others
         """
-        events = []
+        # One clock read for every event time and id
+        now = datetime.now(UTC)
+        today_tag = now.strftime('%Y%m%d')
 
         # For now, create some example high-impact events
         # In production, this would fetch from actual APIs
@@ -261,7 +527,7 @@ class MacroEventsTracker:
         upcoming_events = [
             {
                 'title': 'US CPI (YoY)',
-                'datetime': datetime.now(timezone.utc) + timedelta(days=2, hours=8, minutes=30),
+                'datetime': now + timedelta(days=2, hours=8, minutes=30),
                 'importance': EventImportance.HIGH,
                 'forecast': '3.2%',
                 'previous': '3.7%',
@@ -269,7 +535,7 @@ class MacroEventsTracker:
             },
             {
                 'title': 'US Non-Farm Payrolls',
-                'datetime': datetime.now(timezone.utc) + timedelta(days=5, hours=8, minutes=30),
+                'datetime': now + timedelta(days=5, hours=8, minutes=30),
                 'importance': EventImportance.HIGH,
                 'forecast': '180K',
                 'previous': '150K',
@@ -277,15 +543,19 @@ class MacroEventsTracker:
             },
             {
                 'title': 'FOMC Minutes',
-                'datetime': datetime.now(timezone.utc) + timedelta(days=3, hours=14),
+                'datetime': now + timedelta(days=3, hours=14),
                 'importance': EventImportance.HIGH,
                 'impact': 'Watch for hawkish/dovish language changes'
             }
         ]
 
         for event_data in upcoming_events:
-            event = MacroEvent(
-                id=f"econ_{event_data['title'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}",
+            # Out-of-window entries are dropped before an event object is built
+            if cutoff is not None and event_data['datetime'] > cutoff:
+                continue
+
+            yield MacroEvent(
+                id=f"econ_{event_data['title'].replace(' ', '_')}_{today_tag}",
                 title=event_data['title'],
                 category=EventCategory.ECONOMIC_DATA,
                 importance=event_data['importance'],
@@ -297,9 +567,6 @@ class MacroEventsTracker:
                 previous=event_data.get('previous'),
                 affected_assets=["SPY", "DXY", "VIX"]
             )
-            events.append(event)
-
-        return events
 
     def fetch_geopolitical_events(self) -> List[MacroEvent]:
         """
@@ -319,11 +586,51 @@ class MacroEventsTracker:
 
         return events
 
+    async def fetch_all_sources(self, cutoff: Optional[datetime] = None) -> List[MacroEvent]:
+        """Fetch every event source concurrently; sources that can skip events after cutoff do
+
+        Total latency is the slowest network source rather than the sum of them.
+        The economic and geopolitical sources are still local placeholders, so
+        they run in the thread pool until they gain async API fetchers.
+        """
+        # One keep-alive client per call: get_upcoming_events runs each fetch in a
+        # fresh event loop, and the client's connections are bound to that loop
+        async with httpx.AsyncClient(headers=self.headers, timeout=FETCH_TIMEOUT, follow_redirects=True) as client:
+            results = await asyncio.gather(
+                self._afetch_fed_calendar(client),
+                asyncio.to_thread(list, self.fetch_economic_calendar(cutoff=cutoff)),
+                asyncio.to_thread(self.fetch_geopolitical_events),
+                return_exceptions=True
+            )
+
+        all_events = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching macro events: {result}")
+            else:
+                all_events.extend(result)
+        return all_events
+
+    def _fetch_all_events(self, cutoff: Optional[datetime] = None) -> List[MacroEvent]:
+        """Sync entry point for fetch_all_sources"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.fetch_all_sources(cutoff))
+
+        # Already inside an event loop, where asyncio.run can't be used - fetch serially
+        return [
+            *self.fetch_fed_calendar(),
+            *self.fetch_economic_calendar(cutoff=cutoff),
+            *self.fetch_geopolitical_events()
+        ]
+
     def get_upcoming_events(
         self,
         hours_ahead: int = 48,
         categories: Optional[List[EventCategory]] = None,
-        min_importance: EventImportance = EventImportance.MEDIUM
+        min_importance: EventImportance = EventImportance.MEDIUM,
+        now: Optional[datetime] = None
     ) -> List[MacroEvent]:
         """
         Get upcoming macro events
@@ -332,51 +639,40 @@ class MacroEventsTracker:
             hours_ahead: Hours to look ahead
             categories: Filter by categories
             min_importance: Minimum importance level
+            now: Start of the window (defaults to the current UTC time)
 
         Returns:
             List of upcoming events sorted by datetime
         """
-        all_events = []
-
-        # Fetch from various sources
-        all_events.extend(self.fetch_fed_calendar())
-        all_events.extend(self.fetch_economic_calendar())
-        all_events.extend(self.fetch_geopolitical_events())
-
         # Filter by time window
-        cutoff_time = datetime.now(timezone.utc) + timedelta(hours=hours_ahead)
-        current_time = datetime.now(timezone.utc)
-
-        filtered_events = [
-            event for event in all_events
-            if current_time <= event.datetime <= cutoff_time
-        ]
+        current_time = now or datetime.now(UTC)
+        cutoff_time = current_time + timedelta(hours=hours_ahead)
+
+        # Fetch from various sources concurrently
+        all_events = self._fetch_all_events(cutoff_time)
+
+        if not all_events:
+            return []
+
+        # Filter columns once as vectorized masks; all_events stays the canonical store
+        frame = pd.DataFrame({
+            'datetime': pd.to_datetime([event.datetime for event in all_events], utc=True),
+            'category': [event.category for event in all_events],
+            'importance': [int(event.importance) for event in all_events]
+        })
+        mask = (
+            (frame['datetime'] >= current_time)
+            & (frame['datetime'] <= cutoff_time)
+            & (frame['importance'] >= min_importance)
+        )
 
         # Filter by categories if specified
         if categories:
-            filtered_events = [
-                event for event in filtered_events
-                if event.category in categories
-            ]
-
-        # Filter by importance
-        importance_levels = {
-            EventImportance.LOW: 0,
-            EventImportance.MEDIUM: 1,
-            EventImportance.HIGH: 2,
-            EventImportance.CRITICAL: 3
-        }
-
-        min_level = importance_levels[min_importance]
-        filtered_events = [
-            event for event in filtered_events
-            if importance_levels[event.importance] >= min_level
-        ]
-
-        # Sort by datetime
-        filtered_events.sort(key=lambda x: x.datetime)
+            mask &= frame['category'].isin(categories)
 
-        return filtered_events
+        # Sort by datetime; stable, so same-time events keep their source order
+        order = frame.loc[mask, 'datetime'].sort_values(kind='stable').index
+        return [all_events[i] for i in order]
 
     def get_today_events(self) -> Dict[str, List[MacroEvent]]:
         """
@@ -385,8 +681,9 @@ class MacroEventsTracker:
         Returns:
             Dict with 'pre_market', 'regular_hours', 'after_hours' events
         """
-        today = datetime.now(timezone.utc).date()
-        today_events = self.get_upcoming_events(hours_ahead=24)
+        now = datetime.now(UTC)
+        today = now.date()
+        today_events = self.get_upcoming_events(hours_ahead=24, now=now)
 
         # Filter for today only
         today_events = [
@@ -400,12 +697,13 @@ class MacroEventsTracker:
         after_hours = []  # After 4:00 PM ET
 
         for event in today_events:
-            # Convert to ET (UTC-5 or UTC-4 for DST)
-            et_hour = event.datetime.hour - 5  # Simplified, adjust for DST
+            # Convert to ET (UTC-5, or UTC-4 during DST)
+            et = event.datetime.astimezone(MARKET_TZ)
+            et_minute = et.hour * 60 + et.minute
 
-            if et_hour < 9.5:
+            if et_minute < MARKET_OPEN_MINUTE:
                 pre_market.append(event)
-            elif et_hour < 16:
+            elif et_minute < MARKET_CLOSE_MINUTE:
                 regular.append(event)
             else:
                 after_hours.append(event)
@@ -434,9 +732,35 @@ class MacroEventsTracker:
                 'risk_windows': []
             }
 
-        # Count high-impact events
-        critical_count = sum(1 for e in events if e.importance == EventImportance.CRITICAL)
-        high_count = sum(1 for e in events if e.importance == EventImportance.HIGH)
+        # Count high-impact events and collect them in one pass
+        if count_impact_levels is not None and len(events) >= JIT_MIN_EVENTS:
+            # Large replays: count in the compiled kernel, touching only high-impact events in Python
+            levels = np.fromiter((event.importance for event in events), dtype=np.int8, count=len(events))
+            critical_count, high_count = count_impact_levels(levels)
+            risk_events = [events[i] for i in np.flatnonzero(levels >= EventImportance.HIGH)]
+        else:
+            critical_count = high_count = 0
+            risk_events = []
+            for event in events:
+                importance = event.importance
+                if importance < EventImportance.HIGH:
+                    continue
+
+                if importance == EventImportance.CRITICAL:
+                    critical_count += 1
+                else:
+                    high_count += 1
+                risk_events.append(event)
+
+        # Identify key risk windows
+        risk_windows = [
+            {
+                'time': event.datetime.strftime('%Y-%m-%d %H:%M UTC'),
+                'event': event.title,
+                'impact': event.impact
+            }
+            for event in risk_events
+        ]
 
         # Assess overall impact
         if critical_count > 0:
@@ -456,16 +780,6 @@ class MacroEventsTracker:
             risk = 'low'
             action = 'normal trading'
 
-        # Identify key risk windows
-        risk_windows = []
-        for event in events:
-            if event.importance in [EventImportance.CRITICAL, EventImportance.HIGH]:
-                risk_windows.append({
-                    'time': event.datetime.strftime('%Y-%m-%d %H:%M UTC'),
-                    'event': event.title,
-                    'impact': event.impact
-                })
-
         return {
             'volatility_expectation': volatility,
             'risk_level': risk,
@@ -492,110 +806,17 @@ class MacroEventsTracker:
 
         return powell_events
 
-    def _parse_fed_time(self, time_str: str) -> str:
-        """Parse Fed time format (e.g., '2:30 p.m.' -> '14:30')"""
-        try:
-            time_str = time_str.strip().lower()
-
-            # Remove periods
-            time_str = time_str.replace('.', '')
-
-            # Parse time parts
-            is_pm = 'pm' in time_str or 'p.m' in time_str
-            is_am = 'am' in time_str or 'a.m' in time_str
-
-            # Remove am/pm indicators
-            time_str = time_str.replace('pm', '').replace('p.m', '')
-            time_str = time_str.replace('am', '').replace('a.m', '')
-            time_str = time_str.strip()
-
-            # Split hours and minutes
-            if ':' in time_str:
-                parts = time_str.split(':')
-                hours = int(parts[0])
-                minutes = int(parts[1]) if len(parts) > 1 else 0
-            else:
-                hours = int(time_str)
-                minutes = 0
-
-            # Convert to 24-hour format
-            if is_pm and hours != 12:
-                hours += 12
-            elif is_am and hours == 12:
-                hours = 0
-
-            return f"{hours:02d}:{minutes:02d}"
-
-        except Exception as e:
-            logger.warning(f"Could not parse time: {time_str} - {e}")
-            return "12:00"  # Default to noon
-
-    def _parse_datetime(self, datetime_str: str) -> datetime:
-        """Parse various datetime formats"""
-        # Clean up the string
-        datetime_str = datetime_str.strip()
-
-        # Try common formats
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M',
-            '%Y-%m-%d',
-            '%Y/%m/%d %H:%M',
-            '%Y/%m/%d',
-            '%m/%d/%Y %H:%M',
-            '%m/%d/%Y',
-            '%m/%d/%y %H:%M',
-            '%m/%d/%y',
-            '%B %d, %Y',
-            '%B %d, %Y %H:%M',
-            '%b %d, %Y',
-            '%b %d, %Y %H:%M',
-            '%d %B %Y',
-            '%d %b %Y'
-        ]
-
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(datetime_str, fmt)
-                # Add timezone if not present
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt
-            except ValueError:
-                continue
-
-        # Try ISO format
-        try:
-            dt = datetime.fromisoformat(datetime_str)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-        except:
-            pass
-
-        # Default to now if parsing fails
-        logger.warning(f"Could not parse datetime: {datetime_str}")
-        return datetime.now(timezone.utc)
-
     def save_to_cache(self, events: List[MacroEvent]):
         """Save events to cache"""
         cache_file = EVENTS_CACHE_DIR / f"events_{datetime.now().strftime('%Y%m%d')}.json"
 
+        # orjson serializes the dataclasses directly in one pass: enums as their values,
+        # datetimes as ISO 8601 (naive ones as UTC)
         data = {
-            'updated_at': datetime.now(timezone.utc).isoformat(),
-            'events': [
-                {
-                    **asdict(event),
-                    'datetime': event.datetime.isoformat(),
-                    'category': event.category.value,
-                    'importance': event.importance.value
-                }
-                for event in events
-            ]
+            'updated_at': datetime.now(UTC),
+            'events': events
         }
-
-        with open(cache_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        cache_file.write_bytes(orjson.dumps(data, option=orjson.OPT_NAIVE_UTC))
 
         logger.info(f"Saved {len(events)} events to cache")
 
@@ -603,17 +824,18 @@ class MacroEventsTracker:
         """Load events from cache"""
         cache_file = EVENTS_CACHE_DIR / f"events_{datetime.now().strftime('%Y%m%d')}.json"
 
-        if not cache_file.exists():
+        # Check if cache is recent from its mtime, before reading or parsing anything
+        try:
+            if time.time() - cache_file.stat().st_mtime > EVENTS_CACHE_MAX_AGE:
+                return None
+        except FileNotFoundError:
             return None
 
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-
-            # Check if cache is recent (within 1 hour)
-            updated_at = datetime.fromisoformat(data['updated_at'])
-            if (datetime.now(timezone.utc) - updated_at).total_seconds() > 3600:
-                return None
+            # Parse straight from the page cache rather than copying the file into bytes first
+            with open(cache_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    data = orjson.loads(view)
 
             # Convert back to MacroEvent objects
             events = []
@@ -641,7 +863,7 @@ def main():
     for event in events[:10]:  # Show first 10
         print(f"\n{event.datetime.strftime('%Y-%m-%d %H:%M')} - {event.title}")
         print(f"  Category: {event.category.value}")
-        print(f"  Importance: {event.importance.value}")
+        print(f"  Importance: {event.importance.label}")
         print(f"  Impact: {event.impact}")
         if event.speakers:
             print(f"  Speakers: {', '.join(event.speakers)}")
@@ -4,24 +4,46 @@ MCP Server for Chart Signals - Integrated with Real Alpaca Data
 This implements the proper MCP protocol with real market data
 """
 
-import json
+import os
 import sys
+import math
 import asyncio
+import functools
+import orjson
 from typing import Dict, Any, List, Optional, Literal
 import logging
+import atexit
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG, filename='/tmp/mcp_chart_signals.log')
+# Set up logging - records are queued and written to the file on a background thread
+# so request handling never blocks on log I/O. Set MCP_LOG_LEVEL=DEBUG for payload logs.
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.FileHandler('/tmp/mcp_chart_signals.log'))
+logging.basicConfig(level=os.getenv("MCP_LOG_LEVEL", "INFO").upper(), handlers=[QueueHandler(_log_queue)])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+def restart_log_listener():
+    """Start a fresh log writer thread in a forked child - threads don't survive fork"""
+    global _log_listener
+    atexit.unregister(_log_listener.stop)
+    _log_listener = QueueListener(_log_queue, *_log_listener.handlers)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
 # Import data processing
-import os
 from dotenv import load_dotenv
 import pandas as pd
 import pandas_ta as ta
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import sys
 from pathlib import Path
 
@@ -30,6 +52,8 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent.absolute()
 DATA_DIR = PROJECT_ROOT / "data"
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from servers.trading.indicators import compute_all, atr_last, ATR_LENGTH, INDICATOR_COLUMNS
+
 # Import news collector (lazy import inside methods to avoid dependency issues)
 NEWS_COLLECTOR = None
 
@@ -40,7 +64,164 @@ DARPA_MONITOR = None
 env_path = PROJECT_ROOT / ".env"
 load_dotenv(env_path)
 
-CANDLES = {}  # In-memory cache
+# Bars with indicators per (symbol, timeframe, parquet mtimes); a rewritten file misses the cache
+SIGNAL_FRAME_CACHE_SIZE = 128
+MIN_SIGNAL_BARS = 35
+
+# Indicator values reported for the last bar, and the subset for the bar before it
+SNAPSHOT_COLUMNS = ("close", "ema9", "ma10", "macd", "signal", "hist", "rsi",
+                    "bb_upper", "bb_middle", "bb_lower", "vwap", "volume")
+PREV_SNAPSHOT_COLUMNS = ("close", "ema9", "ma10", "macd", "signal", "hist", "rsi", "volume")
+
+# Columns read for the trailing bars: snapshots, trend state and risk anchor
+IND_COLS = SNAPSHOT_COLUMNS + ("high", "low")
+
+# Parquet columns the signal pipeline reads; anything else in the files is skipped
+BAR_COLUMNS = ["time", "open", "high", "low", "close", "volume"]
+
+# stdin framing
+READ_CHUNK_SIZE = 64 * 1024
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024  # Drop a partial message that grows past this
+
+# Concurrent per-symbol snapshot requests when a batched check fails
+TICKER_CHECK_WORKERS = 5
+
+# Most events returned by get_darpa_events, highest importance first
+DARPA_EVENTS_LIMIT = 30
+
+# Watchlist symbols whose signals are loaded and computed concurrently
+WATCHLIST_WORKERS = 8
+
+# Tool definitions are static, so build and serialize the tools/list result once
+TOOLS = [
+    {
+        "name": "get_signals",
+        "description": "Get real-time trading signals for a symbol",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Stock or crypto symbol"
+                },
+                "timeframe": {
+                    "type": "string",
+                    "enum": ["1min", "5min", "15min", "1hour"],
+                    "default": "1min"
+                }
+            },
+            "required": ["symbol"]
+        }
+    },
+    {
+        "name": "get_watchlist",
+        "description": "Get current watchlist with real prices",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+    {
+        "name": "check_market_status",
+        "description": "Check if markets are open",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+    {
+        "name": "get_storage_info",
+        "description": "Get information about stored data",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+    {
+        "name": "get_capabilities",
+        "description": "Get server capabilities and version",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+    {
+        "name": "get_macro_events",
+        "description": "Get upcoming macro events (Fed, FOMC, economic data)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "hours_ahead": {
+                    "type": "integer",
+                    "description": "Hours to look ahead (default: 48)",
+                    "default": 48
+                },
+                "min_importance": {
+                    "type": "string",
+                    "enum": ["low", "medium", "high", "critical"],
+                    "default": "medium"
+                }
+            }
+        }
+    },
+    {
+        "name": "get_powell_schedule",
+        "description": "Get Jerome Powell's speaking schedule",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+    {
+        "name": "get_darpa_events",
+        "description": "Get DARPA-style frontier tech events and signals",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "hours_back": {
+                    "type": "integer",
+                    "description": "Hours to look back for recent events (default: 24)",
+                    "default": 24
+                },
+                "source": {
+                    "type": "string",
+                    "enum": ["all", "darpa", "dod_contracts", "arxiv"],
+                    "default": "all"
+                }
+            }
+        }
+    },
+    {
+        "name": "check_ticker_availability",
+        "description": "Check Alpaca data availability for tickers",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "symbols": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of ticker symbols to check"
+                }
+            },
+            "required": ["symbols"]
+        }
+    }
+]
+
+TOOLS_LIST_RESULT = {"tools": TOOLS}
+TOOLS_LIST_JSON = orjson.dumps(TOOLS_LIST_RESULT)
+
+def make_http_session():
+    """Build a requests session that pools connections per host and retries transient failures"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=Retry(total=3, backoff_factor=0.2))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
 def ensure_data_directories():
     """Create data directory structure if needed"""
@@ -49,124 +230,237 @@ def ensure_data_directories():
             path = DATA_DIR / asset_type / timeframe
             path.mkdir(parents=True, exist_ok=True)
 
-def load_from_parquet(symbol: str, timeframe: str = "1min", is_crypto: bool = False, days_back: int = 7) -> Optional[pd.DataFrame]:
-    """Load historical data from parquet files"""
-    all_data = []
+def parquet_paths(symbol: str, timeframe: str, is_crypto: bool) -> List[Path]:
+    """Current and previous month parquet files for a symbol (whether or not they exist)"""
     # Clean symbol name for filesystem (replace / with _)
     clean_symbol = symbol.replace("/", "_")
-
-    # Check current and previous month files
+    paths = []
     for month_offset in range(2):
         month = datetime.now() - timedelta(days=30 * month_offset)
         month_str = month.strftime("%Y-%m")
-        file_path = DATA_DIR / ("crypto" if is_crypto else "stocks") / timeframe / f"{clean_symbol}_{month_str}.parquet"
+        paths.append(DATA_DIR / ("crypto" if is_crypto else "stocks") / timeframe / f"{clean_symbol}_{month_str}.parquet")
+    return paths
+
+def load_from_parquet(symbol: str, timeframe: str = "1min", is_crypto: bool = False, days_back: int = 7) -> Optional[pd.DataFrame]:
+    """Load historical data from parquet files"""
+    tables = []
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
 
+    # Check current and previous month files; read only the bar columns and
+    # let pyarrow skip row groups that end before the cutoff
+    for file_path in parquet_paths(symbol, timeframe, is_crypto):
         if file_path.exists():
             try:
-                df = pd.read_parquet(file_path)
-                all_data.append(df)
-                logger.info(f"Loaded {len(df)} bars from {file_path.name}")
+                table = pq.read_table(file_path, columns=BAR_COLUMNS, filters=[("time", ">=", cutoff_date)])
+                tables.append(table)
+                logger.info("Loaded %d bars from %s", table.num_rows, file_path.name)
             except Exception as e:
                 logger.error(f"Error loading {file_path}: {e}")
 
-    if all_data:
-        combined = pd.concat(all_data, ignore_index=True)
+    if tables:
+        combined = pa.concat_tables(tables, promote_options="default").to_pandas()
         combined = combined.drop_duplicates(subset=["time"]).sort_values("time")
         # Filter to requested days - ensure timezone-aware comparison
         combined["time"] = pd.to_datetime(combined["time"])
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
         return combined[combined["time"] >= cutoff_date]
 
     return None
 
+def aggregate_bars(df_1min: pd.DataFrame, target_tf: str) -> pd.DataFrame:
+    """Aggregate 1min data to larger timeframe"""
+    df = df_1min.copy()
+    df["time"] = pd.to_datetime(df["time"])
+    df.set_index("time", inplace=True)
+
+    # Resample mapping (using new pandas notation)
+    resample_map = {
+        "5min": "5min",
+        "15min": "15min",
+        "1hour": "1h"
+    }
+
+    if target_tf in resample_map:
+        df_resampled = df.resample(resample_map[target_tf]).agg({
+            "open": "first",
+            "high": "max",
+            "low": "min",
+            "close": "last",
+            "volume": "sum"
+        }).dropna()
+        return df_resampled.reset_index()
+
+    return df_1min
+
+def load_signal_frame(symbol: str, timeframe: str, is_crypto: bool):
+    """Bars with indicators for get_signals, cached until a source parquet file changes
+
+    Returns (df, bars): df is indexed by time and shared between callers, so
+    treat it as read-only; it is None when fewer than MIN_SIGNAL_BARS bars are
+    available, with bars the count that was found.
+    """
+    paths = parquet_paths(symbol, timeframe, is_crypto)
+    if timeframe != "1min":
+        paths += parquet_paths(symbol, "1min", is_crypto)
+
+    mtime_sig = []
+    for path in paths:
+        try:
+            mtime_sig.append((path.name, path.stat().st_mtime_ns))
+        except FileNotFoundError:
+            pass
+
+    return _load_and_compute(symbol, timeframe, is_crypto, tuple(sorted(mtime_sig)))
+
+@functools.lru_cache(maxsize=SIGNAL_FRAME_CACHE_SIZE)
+def _load_and_compute(symbol: str, timeframe: str, is_crypto: bool, mtime_sig: tuple):
+    """Uncached load_signal_frame; mtime_sig only keys the cache"""
+    df = load_from_parquet(symbol, timeframe, is_crypto, days_back=7)
+
+    if df is None or len(df) < MIN_SIGNAL_BARS:
+        # Try loading 1min and aggregating if larger timeframe requested
+        if timeframe == "1min":
+            return None, len(df) if df is not None else 0
+        df_1min = load_from_parquet(symbol, "1min", is_crypto, days_back=7)
+        if df_1min is None or len(df_1min) < MIN_SIGNAL_BARS:
+            return None, len(df_1min) if df_1min is not None else 0
+        df = aggregate_bars(df_1min, timeframe)
+
+    # Prepare dataframe
+    df["time"] = pd.to_datetime(df["time"])
+    df.set_index("time", inplace=True)
+
+    add_indicators(df)
+    return df, len(df)
+
 def calculate_vwap(df: pd.DataFrame) -> pd.Series:
     """Calculate VWAP (Volume Weighted Average Price)"""
-    typical_price = (df["high"] + df["low"] + df["close"]) / 3
-    vwap = (typical_price * df["volume"]).cumsum() / df["volume"].cumsum()
-    return vwap
+    volume = _column(df, "volume")
+    price_volume = (_column(df, "high") + _column(df, "low") + _column(df, "close")) * volume * (1.0 / 3.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        vwap = np.cumsum(price_volume) / np.cumsum(volume)
+    return pd.Series(vwap, index=df.index, name="vwap")
+
+def _column(df: pd.DataFrame, name: str) -> np.ndarray:
+    """Column as a float array; missing indicator values (None) become NaN so comparisons are False"""
+    return df[name].to_numpy(dtype=float, na_value=np.nan)
+
+def add_indicators(df: pd.DataFrame) -> None:
+    """Add EMA9, MA10, MACD, RSI, Bollinger Band and VWAP columns to df in place"""
+    if compute_all is not None:
+        # One compiled pass over the bar arrays instead of a pandas_ta call per indicator
+        outputs = [np.empty(len(df)) for _ in INDICATOR_COLUMNS]
+        compute_all(
+            np.ascontiguousarray(_column(df, "close")),
+            np.ascontiguousarray(_column(df, "high")),
+            np.ascontiguousarray(_column(df, "low")),
+            np.ascontiguousarray(_column(df, "volume")),
+            *outputs
+        )
+        for name, values in zip(INDICATOR_COLUMNS, outputs):
+            df[name] = values
+        return
+
+    df["ema9"] = ta.ema(df["close"], length=9)
+    df["ma10"] = ta.sma(df["close"], length=10)
+
+    # MACD calculation with error handling
+    macd = ta.macd(df["close"], fast=12, slow=26, signal=9)
+    if macd is not None and not macd.empty:
+        df["macd"] = macd["MACD_12_26_9"]
+        df["signal"] = macd["MACDs_12_26_9"]
+        df["hist"] = macd["MACDh_12_26_9"]
+    else:
+        df["macd"] = None
+        df["signal"] = None
+        df["hist"] = None
+
+    df["rsi"] = ta.rsi(df["close"], length=14)
+
+    # Bollinger Bands
+    try:
+        bbands = ta.bbands(df["close"], length=20, std=2)
+        if bbands is not None and not bbands.empty:
+            # pandas_ta orders the band columns lower, middle, upper
+            bb_cols = bbands.columns.tolist()
+            df["bb_lower"] = bbands.iloc[:, 0] if len(bb_cols) > 0 else None  # Lower band
+            df["bb_middle"] = bbands.iloc[:, 1] if len(bb_cols) > 1 else None  # Middle band
+            df["bb_upper"] = bbands.iloc[:, 2] if len(bb_cols) > 2 else None  # Upper band
+        else:
+            df["bb_upper"] = None
+            df["bb_middle"] = None
+            df["bb_lower"] = None
+    except Exception as e:
+        logger.warning(f"Bollinger Bands calculation failed: {e}")
+        df["bb_upper"] = None
+        df["bb_middle"] = None
+        df["bb_lower"] = None
+
+    # VWAP
+    df["vwap"] = calculate_vwap(df)
+
+def tail_rows(df: pd.DataFrame, count: int = 2) -> List[Dict[str, float]]:
+    """Last count bars as {column: float} dicts over IND_COLS, missing values as NaN
+
+    One numpy conversion of the tail instead of a pandas label lookup per value.
+    """
+    values = df.iloc[-count:][list(IND_COLS)].to_numpy(dtype=float, na_value=np.nan).tolist()
+    return [dict(zip(IND_COLS, row)) for row in values]
+
+def snapshot_dict(columns, row: Dict[str, float], time) -> Dict[str, Any]:
+    """Bar values keyed by column, close reported as price and NaN as None"""
+    snapshot = {}
+    for column in columns:
+        value = row[column]
+        snapshot["price" if column == "close" else column] = None if math.isnan(value) else value
+    snapshot["time"] = str(time)
+    return snapshot
 
 def detect_crossings_with_history(df: pd.DataFrame) -> Dict[str, Any]:
     """Detect crossings and track bars since last cross"""
     if len(df) < 2:
         return {}
 
-    crossings = {}
-    bars_since = {}
-    last_cross_info = {"type": None, "at": None}
-
-    # Get last two bars
-    last = df.iloc[-1]
-    prev = df.iloc[-2]
+    n = len(df)
+    close = _column(df, "close")
+    ema9 = _column(df, "ema9")
+    macd = _column(df, "macd")
+    signal = _column(df, "signal")
+    rsi = _column(df, "rsi")
+    bb_upper = _column(df, "bb_upper")
+    bb_middle = _column(df, "bb_middle")
+    bb_lower = _column(df, "bb_lower")
+
+    # Cross masks over consecutive bar pairs: element j is the cross into bar j + 1
+    cross_masks = {
+        "macd_cross_up": (macd[:-1] <= signal[:-1]) & (macd[1:] > signal[1:]),
+        "macd_cross_dn": (macd[:-1] >= signal[:-1]) & (macd[1:] < signal[1:]),
+        "ema_support_lost": (close[:-1] >= ema9[:-1]) & (close[1:] < ema9[1:]),
+        "ema_reclaim": (close[:-1] <= ema9[:-1]) & (close[1:] > ema9[1:]),
+    }
 
-    # Basic crossings - handle None values
-    crossings["macd_cross_up"] = bool(
-        prev["macd"] is not None and prev["signal"] is not None and
-        last["macd"] is not None and last["signal"] is not None and
-        prev["macd"] <= prev["signal"] and last["macd"] > last["signal"]
-    )
-    crossings["macd_cross_dn"] = bool(
-        prev["macd"] is not None and prev["signal"] is not None and
-        last["macd"] is not None and last["signal"] is not None and
-        prev["macd"] >= prev["signal"] and last["macd"] < last["signal"]
-    )
-    crossings["ema_support_lost"] = bool(
-        prev["ema9"] is not None and last["ema9"] is not None and
-        prev["close"] >= prev["ema9"] and last["close"] < last["ema9"]
-    )
-    crossings["ema_reclaim"] = bool(
-        prev["ema9"] is not None and last["ema9"] is not None and
-        prev["close"] <= prev["ema9"] and last["close"] > last["ema9"]
-    )
-    crossings["rsi_overbought"] = bool(last["rsi"] is not None and last["rsi"] >= 70)
-    crossings["rsi_oversold"] = bool(last["rsi"] is not None and last["rsi"] <= 30)
+    # Basic crossings on the last two bars - NaN compares False
+    crossings = {name: bool(mask[-1]) for name, mask in cross_masks.items()}
+    crossings["rsi_overbought"] = bool(rsi[-1] >= 70)
+    crossings["rsi_oversold"] = bool(rsi[-1] <= 30)
     crossings["bb_squeeze"] = bool(
-        last["bb_upper"] is not None and last["bb_lower"] is not None and
-        last["bb_middle"] is not None and last["bb_middle"] != 0 and
-        (last["bb_upper"] - last["bb_lower"]) / last["bb_middle"] < 0.04
-    )
-    crossings["bb_breakout_up"] = bool(
-        last["bb_upper"] is not None and last["close"] > last["bb_upper"]
-    )
-    crossings["bb_breakout_dn"] = bool(
-        last["bb_lower"] is not None and last["close"] < last["bb_lower"]
+        bb_middle[-1] != 0 and (bb_upper[-1] - bb_lower[-1]) / bb_middle[-1] < 0.04
     )
+    crossings["bb_breakout_up"] = bool(close[-1] > bb_upper[-1])
+    crossings["bb_breakout_dn"] = bool(close[-1] < bb_lower[-1])
 
-    # Count bars since each type of crossing
-    for i in range(len(df) - 1, -1, -1):
-        row = df.iloc[i]
-        prev_row = df.iloc[i - 1] if i > 0 else None
-
-        # MACD crosses
-        if prev_row is not None:
-            # Check for None values before comparison
-            if (prev_row["macd"] is not None and prev_row["signal"] is not None and
-                row["macd"] is not None and row["signal"] is not None):
-
-                if prev_row["macd"] <= prev_row["signal"] and row["macd"] > row["signal"]:
-                    if "macd_cross_up_bars" not in bars_since:
-                        bars_since["macd_cross_up_bars"] = len(df) - 1 - i
-                        if not last_cross_info["type"]:
-                            last_cross_info = {"type": "macd_cross_up", "at": str(row.name)}
-
-                if prev_row["macd"] >= prev_row["signal"] and row["macd"] < row["signal"]:
-                    if "macd_cross_dn_bars" not in bars_since:
-                        bars_since["macd_cross_dn_bars"] = len(df) - 1 - i
-                        if not last_cross_info["type"]:
-                            last_cross_info = {"type": "macd_cross_dn", "at": str(row.name)}
-
-            # EMA crosses
-            if (prev_row["ema9"] is not None and row["ema9"] is not None):
-                if prev_row["close"] >= prev_row["ema9"] and row["close"] < row["ema9"]:
-                    if "ema_support_lost_bars" not in bars_since:
-                        bars_since["ema_support_lost_bars"] = len(df) - 1 - i
-                        if not last_cross_info["type"]:
-                            last_cross_info = {"type": "ema_support_lost", "at": str(row.name)}
-
-                if prev_row["close"] <= prev_row["ema9"] and row["close"] > row["ema9"]:
-                    if "ema_reclaim_bars" not in bars_since:
-                        bars_since["ema_reclaim_bars"] = len(df) - 1 - i
-                        if not last_cross_info["type"]:
-                            last_cross_info = {"type": "ema_reclaim", "at": str(row.name)}
+    # Bars since the most recent bar of each crossing type; the latest cross
+    # overall wins, ties resolved in cross_masks order
+    bars_since = {}
+    last_cross_info = {"type": None, "at": None}
+    last_bar = -1
+    for name, mask in cross_masks.items():
+        hits = np.flatnonzero(mask)
+        if hits.size:
+            bar = int(hits[-1]) + 1
+            bars_since[f"{name}_bars"] = n - 1 - bar
+            if bar > last_bar:
+                last_bar = bar
+                last_cross_info = {"type": name, "at": str(df.index[bar])}
 
     return {
         "crossings": crossings,
@@ -180,235 +474,129 @@ class MCPServer:
     def __init__(self):
         self.running = True
         ensure_data_directories()
+        self.http = make_http_session()  # Shared keep-alive pool for upstream HTTP calls
         self.news_collector = None  # Lazy initialize
+        self._news_lock = threading.Lock()  # Watchlist threads share one collector
         self.events_tracker = None  # Lazy initialize
         self.darpa_monitor = None  # Lazy initialize
+
+        # JSON-RPC method and tool dispatch tables; tools take the call's arguments dict
+        self._method_handlers = {
+            "initialize": self._initialize,
+            "tools/list": self._tools_list,
+            "tools/call": self._tools_call,
+        }
+        self._tool_handlers = {
+            "get_signals": lambda args: self.get_signals(args.get("symbol"), args.get("timeframe", "1min")),
+            "get_watchlist": lambda args: self.get_watchlist(),
+            "check_market_status": lambda args: self.check_market_status(),
+            "get_storage_info": lambda args: self.get_storage_info(),
+            "get_capabilities": lambda args: self.get_capabilities(),
+            "get_macro_events": lambda args: self.get_macro_events(
+                args.get("hours_ahead", 48), args.get("min_importance", "medium")
+            ),
+            "get_powell_schedule": lambda args: self.get_powell_schedule(),
+            "get_darpa_events": lambda args: self.get_darpa_events(
+                args.get("hours_back", 24), args.get("source", "all")
+            ),
+            "check_ticker_availability": lambda args: self.check_ticker_availability(args.get("symbols", [])),
+        }
         logger.info("MCP Server initialized with real data integration")
 
+    def reconnect(self):
+        """Drop lazily created clients so a forked process opens its own connections"""
+        self.http = make_http_session()
+        self.news_collector = None
+        self.events_tracker = None
+        self.darpa_monitor = None
+
     async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle incoming JSON-RPC request"""
         method = request.get("method")
         params = request.get("params", {})
         request_id = request.get("id")
 
-        logger.info(f"Handling request: {method}")
+        logger.info("Handling request: %s", method)
 
         # Handle MCP protocol methods
-        if method == "initialize":
-            requested_version = params.get("protocolVersion", "2025-06-18")
+        handler = self._method_handlers.get(method)
+        if handler is None:
+            # Unknown method
             return {
                 "jsonrpc": "2.0",
                 "id": request_id,
-                "result": {
-                    "protocolVersion": requested_version,
-                    "capabilities": {
-                        "tools": {}
-                    },
-                    "serverInfo": {
-                        "name": "chart-signals",
-                        "version": "2.0.0"
-                    }
+                "error": {
+                    "code": -32601,
+                    "message": f"Method not found: {method}"
                 }
             }
 
-        elif method == "tools/list":
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": {
-                    "tools": [
-                        {
-                            "name": "get_signals",
-                            "description": "Get real-time trading signals for a symbol",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "symbol": {
-                                        "type": "string",
-                                        "description": "Stock or crypto symbol"
-                                    },
-                                    "timeframe": {
-                                        "type": "string",
-                                        "enum": ["1min", "5min", "15min", "1hour"],
-                                        "default": "1min"
-                                    }
-                                },
-                                "required": ["symbol"]
-                            }
-                        },
-                        {
-                            "name": "get_watchlist",
-                            "description": "Get current watchlist with real prices",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {}
-                            }
-                        },
-                        {
-                            "name": "check_market_status",
-                            "description": "Check if markets are open",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {}
-                            }
-                        },
-                        {
-                            "name": "get_storage_info",
-                            "description": "Get information about stored data",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {}
-                            }
-                        },
-                        {
-                            "name": "get_capabilities",
-                            "description": "Get server capabilities and version",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {}
-                            }
-                        },
-                        {
-                            "name": "get_macro_events",
-                            "description": "Get upcoming macro events (Fed, FOMC, economic data)",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "hours_ahead": {
-                                        "type": "integer",
-                                        "description": "Hours to look ahead (default: 48)",
-                                        "default": 48
-                                    },
-                                    "min_importance": {
-                                        "type": "string",
-                                        "enum": ["low", "medium", "high", "critical"],
-                                        "default": "medium"
-                                    }
-                                }
-                            }
-                        },
-                        {
-                            "name": "get_powell_schedule",
-                            "description": "Get Jerome Powell's speaking schedule",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {}
-                            }
-                        },
-                        {
-                            "name": "get_darpa_events",
-                            "description": "Get DARPA-style frontier tech events and signals",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "hours_back": {
-                                        "type": "integer",
-                                        "description": "Hours to look back for recent events (default: 24)",
-                                        "default": 24
-                                    },
-                                    "source": {
-                                        "type": "string",
-                                        "enum": ["all", "darpa", "dod_contracts", "arxiv"],
-                                        "default": "all"
-                                    }
-                                }
-                            }
-                        },
-                        {
-                            "name": "check_ticker_availability",
-                            "description": "Check Alpaca data availability for tickers",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "symbols": {
-                                        "type": "array",
-                                        "items": {"type": "string"},
-                                        "description": "List of ticker symbols to check"
-                                    }
-                                },
-                                "required": ["symbols"]
-                            }
-                        }
-                    ]
-                }
-            }
+        # Handlers (tools especially) block on file and network I/O, so run them
+        # in a worker thread and keep the event loop free to read other requests
+        result = await asyncio.to_thread(handler, params)
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": result
+        }
 
-        elif method == "tools/call":
-            tool_name = params.get("name")
-            tool_args = params.get("arguments", {})
+    def _initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """initialize result: echo the client's protocol version"""
+        requested_version = params.get("protocolVersion", "2025-06-18")
+        return {
+            "protocolVersion": requested_version,
+            "capabilities": {
+                "tools": {}
+            },
+            "serverInfo": {
+                "name": "chart-signals",
+                "version": "2.0.0"
+            }
+        }
 
-            logger.info(f"Calling tool: {tool_name} with args: {tool_args}")
+    def _tools_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """tools/list result - static, built once at import"""
+        return TOOLS_LIST_RESULT
 
-            if tool_name == "get_signals":
-                result = self.get_signals(
-                    tool_args.get("symbol"),
-                    tool_args.get("timeframe", "1min")
-                )
-            elif tool_name == "get_watchlist":
-                result = self.get_watchlist()
-            elif tool_name == "check_market_status":
-                result = self.check_market_status()
-            elif tool_name == "get_storage_info":
-                result = self.get_storage_info()
-            elif tool_name == "get_capabilities":
-                result = self.get_capabilities()
-            elif tool_name == "get_macro_events":
-                result = self.get_macro_events(
-                    tool_args.get("hours_ahead", 48),
-                    tool_args.get("min_importance", "medium")
-                )
-            elif tool_name == "get_powell_schedule":
-                result = self.get_powell_schedule()
-            elif tool_name == "get_darpa_events":
-                result = self.get_darpa_events(
-                    tool_args.get("hours_back", 24),
-                    tool_args.get("source", "all")
-                )
-            elif tool_name == "check_ticker_availability":
-                result = self.check_ticker_availability(
-                    tool_args.get("symbols", [])
-                )
-            else:
-                result = {"error": f"Unknown tool: {tool_name}"}
+    def _tools_call(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """tools/call result: the tool's output as a JSON text content block"""
+        tool_name = params.get("name")
+        tool_args = params.get("arguments", {})
 
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": json.dumps(result, indent=2)
-                        }
-                    ]
-                }
-            }
+        logger.info("Calling tool: %s with args: %s", tool_name, tool_args)
 
+        tool = self._tool_handlers.get(tool_name)
+        if tool is not None:
+            result = tool(tool_args)
         else:
-            # Unknown method
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {
-                    "code": -32601,
-                    "message": f"Method not found: {method}"
+            result = {"error": f"Unknown tool: {tool_name}"}
+
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    # Compact: the text is parsed by the client, indentation only adds bytes
+                    "text": orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY).decode()
                 }
-            }
+            ]
+        }
 
     def get_news_sentiment(self, symbol: str) -> Dict[str, Any]:
         """Get news sentiment for a symbol"""
         try:
             # Lazy import and initialize news collector
             if self.news_collector is None:
-                logger.info("Initializing NewsCollector...")
-                from servers.trading.news_collector import NewsCollector
-                self.news_collector = NewsCollector()
-                logger.info("NewsCollector initialized successfully")
+                with self._news_lock:
+                    if self.news_collector is None:
+                        logger.info("Initializing NewsCollector...")
+                        from servers.trading.news_collector import NewsCollector
+                        self.news_collector = NewsCollector()
+                        logger.info("NewsCollector initialized successfully")
 
             # Get aggregated sentiment for last 24 hours
-            logger.info(f"Fetching news sentiment for {symbol}...")
+            logger.info("Fetching news sentiment for %s...", symbol)
             sentiment = self.news_collector.get_aggregated_sentiment(symbol, hours_back=24)
-            logger.info(f"News sentiment for {symbol}: {sentiment.get('sentiment_label')} ({sentiment.get('news_count')} items)")
+            logger.info("News sentiment for %s: %s (%s items)", symbol, sentiment.get('sentiment_label'), sentiment.get('news_count'))
 
             return {
                 "enabled": True,
@@ -457,112 +645,28 @@ class MCPServer:
         else:
             file_symbol = symbol
 
-        # Try to load from memory cache first
-        cache_key = f"{symbol}-{timeframe}"
-
-        # Load from parquet if not in cache
-        df = load_from_parquet(file_symbol, timeframe, is_crypto, days_back=7)
-
-        if df is None or len(df) < 35:
-            # Try loading 1min and aggregating if larger timeframe requested
-            if timeframe != "1min":
-                df_1min = load_from_parquet(file_symbol, "1min", is_crypto, days_back=7)
-                if df_1min is not None and len(df_1min) >= 35:
-                    df = self.aggregate_timeframe(df_1min, timeframe)
-                else:
-                    return {
-                        "ready": False,
-                        "reason": f"insufficient bars (have {len(df_1min) if df_1min is not None else 0}, need 35+)",
-                        "symbol": symbol,
-                        "timeframe": timeframe
-                    }
-            else:
-                return {
-                    "ready": False,
-                    "reason": f"insufficient bars (have {len(df) if df is not None else 0}, need 35+)",
-                    "symbol": symbol,
-                    "timeframe": timeframe
-                }
-
-        # Prepare dataframe
-        df["time"] = pd.to_datetime(df["time"])
-        df.set_index("time", inplace=True)
-
-        # Calculate indicators
-        df["ema9"] = ta.ema(df["close"], length=9)
-        df["ma10"] = ta.sma(df["close"], length=10)
-
-        # MACD calculation with error handling
-        macd = ta.macd(df["close"], fast=12, slow=26, signal=9)
-        if macd is not None and not macd.empty:
-            df["macd"] = macd["MACD_12_26_9"]
-            df["signal"] = macd["MACDs_12_26_9"]
-            df["hist"] = macd["MACDh_12_26_9"]
-        else:
-            df["macd"] = None
-            df["signal"] = None
-            df["hist"] = None
-
-        df["rsi"] = ta.rsi(df["close"], length=14)
-
-        # Bollinger Bands
-        try:
-            bbands = ta.bbands(df["close"], length=20, std=2)
-            if bbands is not None and not bbands.empty:
-                # Get column names dynamically as they may vary
-                bb_cols = bbands.columns.tolist()
-                df["bb_upper"] = bbands.iloc[:, 0] if len(bb_cols) > 0 else None  # Upper band
-                df["bb_middle"] = bbands.iloc[:, 1] if len(bb_cols) > 1 else None  # Middle band
-                df["bb_lower"] = bbands.iloc[:, 2] if len(bb_cols) > 2 else None  # Lower band
-            else:
-                df["bb_upper"] = None
-                df["bb_middle"] = None
-                df["bb_lower"] = None
-        except Exception as e:
-            logger.warning(f"Bollinger Bands calculation failed: {e}")
-            df["bb_upper"] = None
-            df["bb_middle"] = None
-            df["bb_lower"] = None
-
-        # VWAP
-        df["vwap"] = calculate_vwap(df)
+        df, bars = load_signal_frame(file_symbol, timeframe, is_crypto)
+        if df is None:
+            return {
+                "ready": False,
+                "reason": f"insufficient bars (have {bars}, need {MIN_SIGNAL_BARS}+)",
+                "symbol": symbol,
+                "timeframe": timeframe
+            }
 
         # Detect crossings with history
         crossing_data = detect_crossings_with_history(df)
 
         # Get last two bars for comparison
-        last = df.iloc[-1]
-        prev = df.iloc[-2] if len(df) > 1 else last
+        rows = tail_rows(df)
+        last = rows[-1]
+        prev = rows[0]
 
         # Current snapshot
-        snapshot = {
-            "price": float(last["close"]),
-            "ema9": float(last["ema9"]) if not pd.isna(last["ema9"]) else None,
-            "ma10": float(last["ma10"]) if not pd.isna(last["ma10"]) else None,
-            "macd": float(last["macd"]) if not pd.isna(last["macd"]) else None,
-            "signal": float(last["signal"]) if not pd.isna(last["signal"]) else None,
-            "hist": float(last["hist"]) if not pd.isna(last["hist"]) else None,
-            "rsi": float(last["rsi"]) if not pd.isna(last["rsi"]) else None,
-            "bb_upper": float(last["bb_upper"]) if not pd.isna(last["bb_upper"]) else None,
-            "bb_middle": float(last["bb_middle"]) if not pd.isna(last["bb_middle"]) else None,
-            "bb_lower": float(last["bb_lower"]) if not pd.isna(last["bb_lower"]) else None,
-            "vwap": float(last["vwap"]) if not pd.isna(last["vwap"]) else None,
-            "volume": float(last["volume"]),
-            "time": str(df.index[-1])
-        }
+        snapshot = snapshot_dict(SNAPSHOT_COLUMNS, last, df.index[-1])
 
         # Previous snapshot for delta calculations
-        prev_snapshot = {
-            "price": float(prev["close"]),
-            "ema9": float(prev["ema9"]) if not pd.isna(prev["ema9"]) else None,
-            "ma10": float(prev["ma10"]) if not pd.isna(prev["ma10"]) else None,
-            "macd": float(prev["macd"]) if not pd.isna(prev["macd"]) else None,
-            "signal": float(prev["signal"]) if not pd.isna(prev["signal"]) else None,
-            "hist": float(prev["hist"]) if not pd.isna(prev["hist"]) else None,
-            "rsi": float(prev["rsi"]) if not pd.isna(prev["rsi"]) else None,
-            "volume": float(prev["volume"]),
-            "time": str(df.index[-2]) if len(df) > 1 else str(df.index[-1])
-        }
+        prev_snapshot = snapshot_dict(PREV_SNAPSHOT_COLUMNS, prev, df.index[-2] if len(df) > 1 else df.index[-1])
 
         # Calculate trend state
         trend_state = self.calculate_trend_state(last)
@@ -606,83 +710,67 @@ class MCPServer:
 
     def aggregate_timeframe(self, df_1min: pd.DataFrame, target_tf: str) -> pd.DataFrame:
         """Aggregate 1min data to larger timeframe"""
-        df = df_1min.copy()
-        df["time"] = pd.to_datetime(df["time"])
-        df.set_index("time", inplace=True)
-
-        # Resample mapping (using new pandas notation)
-        resample_map = {
-            "5min": "5min",
-            "15min": "15min",
-            "1hour": "1h"
-        }
-
-        if target_tf in resample_map:
-            df_resampled = df.resample(resample_map[target_tf]).agg({
-                "open": "first",
-                "high": "max",
-                "low": "min",
-                "close": "last",
-                "volume": "sum"
-            }).dropna()
-            return df_resampled.reset_index()
-
-        return df_1min
+        return aggregate_bars(df_1min, target_tf)
 
     def get_watchlist(self) -> Dict[str, Any]:
         """Get watchlist with real current data"""
         watchlist_stocks = []
         watchlist_crypto = []
 
+        symbols = []
         try:
             watchlist_path = PROJECT_ROOT / "watchlist.txt"
             with open(watchlist_path, "r") as f:
                 for line in f:
                     line = line.strip()
                     if line and not line.startswith("#"):
-                        symbol = line.upper()
-
-                        # Get latest signals for each symbol
-                        signals_result = self.get_signals(symbol, "1min")
-
-                        if signals_result.get("ready"):
-                            # Get active signals
-                            active_signals = [
-                                k for k, v in signals_result["crossings"].items() if v
-                            ]
-
-                            item = {
-                                "symbol": symbol,
-                                "price": signals_result["snapshot"]["price"],
-                                "rsi": signals_result["snapshot"]["rsi"],
-                                "signals": active_signals
-                            }
+                        symbols.append(line.upper())
+        except FileNotFoundError:
+            logger.warning("watchlist.txt not found")
 
-                            if signals_result["asset_type"] == "crypto":
-                                # Convert to proper crypto symbol format
-                                if "/" not in symbol:
-                                    item["symbol"] = f"{symbol}/USD"
-                                watchlist_crypto.append(item)
-                            else:
-                                watchlist_stocks.append(item)
-                        else:
-                            # No data available yet
-                            item = {
-                                "symbol": symbol,
-                                "price": None,
-                                "rsi": None,
-                                "signals": [],
-                                "note": "No data"
-                            }
+        # Parquet reads release the GIL, so load and compute symbols concurrently
+        if symbols:
+            with ThreadPoolExecutor(max_workers=min(WATCHLIST_WORKERS, len(symbols))) as executor:
+                results = list(executor.map(lambda symbol: self.get_signals(symbol, "1min"), symbols))
+        else:
+            results = []
 
-                            if symbol in ["BTC", "ETH"]:
-                                item["symbol"] = f"{symbol}/USD"
-                                watchlist_crypto.append(item)
-                            else:
-                                watchlist_stocks.append(item)
+        for symbol, signals_result in zip(symbols, results):
+            if signals_result.get("ready"):
+                # Get active signals
+                active_signals = [
+                    k for k, v in signals_result["crossings"].items() if v
+                ]
 
-        except FileNotFoundError:
-            logger.warning("watchlist.txt not found")
+                item = {
+                    "symbol": symbol,
+                    "price": signals_result["snapshot"]["price"],
+                    "rsi": signals_result["snapshot"]["rsi"],
+                    "signals": active_signals
+                }
+
+                if signals_result["asset_type"] == "crypto":
+                    # Convert to proper crypto symbol format
+                    if "/" not in symbol:
+                        item["symbol"] = f"{symbol}/USD"
+                    watchlist_crypto.append(item)
+                else:
+                    watchlist_stocks.append(item)
+            else:
+                # No data available yet
+                item = {
+                    "symbol": symbol,
+                    "price": None,
+                    "rsi": None,
+                    "signals": [],
+                    "note": "No data"
+                }
+
+                if symbol in ["BTC", "ETH"]:
+                    item["symbol"] = f"{symbol}/USD"
+                    watchlist_crypto.append(item)
+                else:
+                    watchlist_stocks.append(item)
 
         return {
             "watchlist": {
@@ -775,17 +863,21 @@ class MCPServer:
                     total_size = 0
                     file_count = 0
 
-                    for timeframe_dir in asset_path.iterdir():
-                        if timeframe_dir.is_dir():
-                            for file in timeframe_dir.glob("*.parquet"):
-                                # Extract symbol from filename
-                                symbol = file.stem.split("_")[0]
-                                if asset_type == "crypto":
-                                    # Convert back to / format
-                                    symbol = symbol.replace("USD", "/USD")
-                                symbols.add(symbol)
-                                total_size += file.stat().st_size
-                                file_count += 1
+                    # One flat scandir walk: entries carry their file type, and stat() is one call per file
+                    for timeframe_entry in os.scandir(asset_path):
+                        if not timeframe_entry.is_dir():
+                            continue
+                        for entry in os.scandir(timeframe_entry.path):
+                            if not entry.name.endswith(".parquet"):
+                                continue
+                            # Extract symbol from filename
+                            symbol = entry.name[:-len(".parquet")].split("_")[0]
+                            if asset_type == "crypto":
+                                # Convert back to / format
+                                symbol = symbol.replace("USD", "/USD")
+                            symbols.add(symbol)
+                            total_size += entry.stat().st_size
+                            file_count += 1
 
                     info["stored_symbols"][asset_type] = sorted(list(symbols))
                     info["total_size_mb"] += total_size / (1024 * 1024)
@@ -814,72 +906,44 @@ class MCPServer:
             "max_bars_in_memory": 3000
         }
 
-    def calculate_trend_state(self, last_row) -> str:
+    def calculate_trend_state(self, last_row: Dict[str, float]) -> str:
         """
         Calculate overall trend state based on multiple indicators
+        last_row is a tail_rows() dict, with NaN for missing values
         Returns: 'bullish', 'bearish', 'mixed', or 'consolidating'
         """
-        bullish_signals = 0
-        bearish_signals = 0
-
-        # Price vs moving averages
-        if not pd.isna(last_row["ema9"]):
-            if last_row["close"] > last_row["ema9"]:
-                bullish_signals += 1
-            else:
-                bearish_signals += 1
-
-        if not pd.isna(last_row["ma10"]):
-            if last_row["close"] > last_row["ma10"]:
-                bullish_signals += 1
-            else:
-                bearish_signals += 1
-
-        # MACD
-        if not pd.isna(last_row["macd"]) and not pd.isna(last_row["signal"]):
-            if last_row["macd"] > last_row["signal"]:
-                bullish_signals += 1
-            else:
-                bearish_signals += 1
-
-            # MACD histogram direction
-            if not pd.isna(last_row["hist"]):
-                if last_row["hist"] > 0:
-                    bullish_signals += 1
-                else:
-                    bearish_signals += 1
-
-        # RSI levels
-        if not pd.isna(last_row["rsi"]):
-            if last_row["rsi"] > 50:
-                bullish_signals += 1
-            else:
-                bearish_signals += 1
-
-            # Extreme RSI levels (stronger signal)
-            if last_row["rsi"] > 70:
-                bearish_signals += 1  # Overbought warning
-            elif last_row["rsi"] < 30:
-                bullish_signals += 1  # Oversold opportunity
-
-        # Bollinger Bands position
-        if not pd.isna(last_row["bb_upper"]) and not pd.isna(last_row["bb_lower"]):
-            bb_range = last_row["bb_upper"] - last_row["bb_lower"]
-            price_position = (last_row["close"] - last_row["bb_lower"]) / bb_range if bb_range > 0 else 0.5
-
-            if price_position > 0.8:
-                bearish_signals += 1  # Near upper band
-            elif price_position < 0.2:
-                bullish_signals += 1  # Near lower band
-            else:
-                pass  # Neutral in middle
-
-        # VWAP comparison
-        if not pd.isna(last_row["vwap"]):
-            if last_row["close"] > last_row["vwap"]:
-                bullish_signals += 1
-            else:
-                bearish_signals += 1
+        close = last_row["close"]
+        rsi = last_row["rsi"]
+        macd_valid = not math.isnan(last_row["macd"]) and not math.isnan(last_row["signal"])
+
+        # Bollinger Bands position; NaN (or flat) bands give 0.5, which votes neither way
+        bb_range = last_row["bb_upper"] - last_row["bb_lower"]
+        price_position = (close - last_row["bb_lower"]) / bb_range if bb_range > 0 else 0.5
+
+        # Each check votes bullish, bearish or not at all; comparisons with a
+        # missing (NaN) indicator are False on both sides, so it abstains
+        bullish_votes = (
+            close > last_row["ema9"],                     # Price vs moving averages
+            close > last_row["ma10"],
+            last_row["macd"] > last_row["signal"],        # MACD
+            macd_valid and last_row["hist"] > 0,          # MACD histogram direction
+            rsi > 50,                                     # RSI levels
+            rsi < 30,                                     # Oversold opportunity
+            price_position < 0.2,                         # Near lower band
+            close > last_row["vwap"],                     # VWAP comparison
+        )
+        bearish_votes = (
+            close <= last_row["ema9"],
+            close <= last_row["ma10"],
+            last_row["macd"] <= last_row["signal"],
+            macd_valid and last_row["hist"] <= 0,
+            rsi <= 50,
+            rsi > 70,                                     # Overbought warning
+            price_position > 0.8,                         # Near upper band
+            close <= last_row["vwap"],
+        )
+        bullish_signals = sum(bullish_votes)
+        bearish_signals = sum(bearish_votes)
 
         # Determine overall state
         total_signals = bullish_signals + bearish_signals
@@ -897,7 +961,7 @@ class MCPServer:
         else:
             return "mixed"
 
-    def calculate_risk_anchor(self, df: pd.DataFrame, last_row, trend_state: str) -> Dict[str, Any]:
+    def calculate_risk_anchor(self, df: pd.DataFrame, last_row: Dict[str, float], trend_state: str) -> Dict[str, Any]:
         """
         Calculate risk anchor (suggested stop loss placement) based on market structure
         Returns dict with stop price and reasoning
@@ -912,15 +976,11 @@ class MCPServer:
         current_price = last_row["close"]
 
         # Method 1: ATR-based stop (if we have enough data)
-        if len(df) >= 14:
+        if len(df) >= ATR_LENGTH:
             # Calculate ATR
-            high_low = df["high"] - df["low"]
-            high_close = abs(df["high"] - df["close"].shift())
-            low_close = abs(df["low"] - df["close"].shift())
-            true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-            atr = true_range.rolling(14).mean().iloc[-1]
+            atr = atr_last(_column(df, "high"), _column(df, "low"), _column(df, "close"))
 
-            if not pd.isna(atr):
+            if not math.isnan(atr):
                 # Use 2x ATR for stop distance
                 atr_stop = current_price - (2 * atr)
                 risk_anchor["price"] = atr_stop
@@ -929,7 +989,7 @@ class MCPServer:
                 risk_anchor["reasoning"] = f"2x ATR ({atr:.2f}) below entry"
 
         # Method 2: Bollinger Band based stop
-        if not pd.isna(last_row["bb_lower"]) and risk_anchor["price"] is None:
+        if not math.isnan(last_row["bb_lower"]) and risk_anchor["price"] is None:
             bb_stop = last_row["bb_lower"] * 0.995  # Slightly below lower band
             risk_anchor["price"] = bb_stop
             risk_anchor["type"] = "Bollinger"
@@ -939,8 +999,8 @@ class MCPServer:
         # Method 3: Recent swing low
         if len(df) >= 20 and (risk_anchor["price"] is None or trend_state == "bullish"):
             # Find recent swing low
-            recent_lows = df["low"].tail(20)
-            swing_low = recent_lows.min()
+            recent_lows = _column(df, "low")[-20:]
+            swing_low = np.nanmin(recent_lows)
 
             if swing_low < current_price:
                 swing_stop = swing_low * 0.995  # Slightly below swing low
@@ -953,7 +1013,7 @@ class MCPServer:
                     risk_anchor["reasoning"] = "Below recent swing low"
 
         # Method 4: Moving average support
-        if not pd.isna(last_row["ema9"]) and trend_state == "bullish":
+        if not math.isnan(last_row["ema9"]) and trend_state == "bullish":
             ema_stop = last_row["ema9"] * 0.99  # 1% below EMA9
 
             # Use EMA stop if it's tighter than current (for strong trends)
@@ -987,7 +1047,7 @@ class MCPServer:
 
             # Lazy initialize events tracker
             if self.events_tracker is None:
-                self.events_tracker = MacroEventsTracker()
+                self.events_tracker = MacroEventsTracker(session=self.http)
                 logger.info("MacroEventsTracker initialized")
 
             # Map importance string to enum
@@ -1018,7 +1078,7 @@ class MCPServer:
                     'datetime': event.datetime.isoformat(),
                     'title': event.title,
                     'category': event.category.value,
-                    'importance': event.importance.value,
+                    'importance': event.importance.label,
                     'impact': event.impact,
                     'speakers': event.speakers,
                     'forecast': event.forecast,
@@ -1054,7 +1114,7 @@ class MCPServer:
             # Lazy initialize if needed
             if self.events_tracker is None:
                 from servers.trading.macro_events_tracker import MacroEventsTracker
-                self.events_tracker = MacroEventsTracker()
+                self.events_tracker = MacroEventsTracker(session=self.http)
 
             # Get Powell events
             powell_events = self.events_tracker.get_powell_schedule()
@@ -1103,7 +1163,7 @@ class MCPServer:
             # Lazy initialize
             if self.darpa_monitor is None:
                 from servers.trading.darpa_events_monitor import DARPAEventsMonitor
-                self.darpa_monitor = DARPAEventsMonitor()
+                self.darpa_monitor = DARPAEventsMonitor(session=self.http)
                 logger.info("DARPAEventsMonitor initialized")
 
             # Get events based on source
@@ -1131,14 +1191,14 @@ class MCPServer:
 
             # Format for response
             formatted_events = []
-            for event in filtered[:30]:  # Limit to 30 events
+            for event in filtered[:DARPA_EVENTS_LIMIT]:
                 formatted_events.append({
                     'datetime': event.datetime.isoformat(),
                     'title': event.title,
                     'source': event.source.value if hasattr(event.source, 'value') else str(event.source),
                     'signal_type': event.signal_type.value if hasattr(event.signal_type, 'value') else str(event.signal_type),
                     'importance': event.importance,
-                    'companies': event.companies,
+                    'companies': sorted(event.companies),
                     'technology_domain': event.technology_domain,
                     'description': event.description,
                     'url': event.url,
@@ -1221,30 +1281,11 @@ class MCPServer:
                         }
 
             except Exception as e:
-                # Fallback to checking individually
-                for symbol in symbols:
-                    try:
-                        request = StockSnapshotRequest(symbol_or_symbols=symbol)
-                        snapshot_data = client.get_stock_snapshot(request)
-
-                        if symbol in snapshot_data and snapshot_data[symbol] and snapshot_data[symbol].latest_trade:
-                            snapshot = snapshot_data[symbol]
-                            results[symbol] = {
-                                'available': True,
-                                'last_price': float(snapshot.latest_trade.price),
-                                'last_update': snapshot.latest_trade.timestamp.isoformat(),
-                                'data_quality': 'real-time'
-                            }
-                        else:
-                            results[symbol] = {
-                                'available': False,
-                                'reason': 'No data available'
-                            }
-                    except Exception as sym_err:
-                        results[symbol] = {
-                            'available': False,
-                            'reason': str(sym_err)[:100]
-                        }
+                # Fallback to checking individually - calls are I/O bound, so run a few at once
+                with ThreadPoolExecutor(max_workers=min(TICKER_CHECK_WORKERS, len(symbols))) as executor:
+                    results = dict(zip(symbols, executor.map(
+                        lambda symbol: self._check_single_ticker(client, symbol), symbols
+                    )))
 
             # Summary
             available_count = sum(1 for r in results.values() if r.get('available', False))
@@ -1266,6 +1307,32 @@ class MCPServer:
                 'results': {}
             }
 
+    def _check_single_ticker(self, client, symbol: str) -> Dict[str, Any]:
+        """Check one symbol with its own snapshot request"""
+        from alpaca.data.requests import StockSnapshotRequest
+
+        try:
+            request = StockSnapshotRequest(symbol_or_symbols=symbol)
+            snapshot_data = client.get_stock_snapshot(request)
+
+            if symbol in snapshot_data and snapshot_data[symbol] and snapshot_data[symbol].latest_trade:
+                snapshot = snapshot_data[symbol]
+                return {
+                    'available': True,
+                    'last_price': float(snapshot.latest_trade.price),
+                    'last_update': snapshot.latest_trade.timestamp.isoformat(),
+                    'data_quality': 'real-time'
+                }
+            return {
+                'available': False,
+                'reason': 'No data available'
+            }
+        except Exception as sym_err:
+            return {
+                'available': False,
+                'reason': str(sym_err)[:100]
+            }
+
     async def run(self):
         """Main loop to handle stdin/stdout communication"""
         logger.info("MCP Server starting main loop")
@@ -1274,46 +1341,79 @@ class MCPServer:
         protocol = asyncio.StreamReaderProtocol(reader)
         await asyncio.get_event_loop().connect_read_pipe(lambda: protocol, sys.stdin)
 
-        while self.running:
-            try:
-                # Read line from stdin
-                line = await reader.readline()
-                if not line:
-                    break
-
-                # Parse JSON-RPC request
-                line_str = line.decode('utf-8').strip()
-                if not line_str:
-                    continue
-
-                logger.info(f"Received: {line_str[:200]}")
+        buffer = bytearray()
+        pending = set()
 
-                try:
-                    request = json.loads(line_str)
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON decode error: {e}")
-                    continue
-
-                # Handle request
-                response = await self.handle_request(request)
+        while self.running:
+            # Read stdin in large chunks and split out newline-delimited messages
+            chunk = await reader.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            buffer += chunk
+
+            while (newline := buffer.find(b"\n")) >= 0:
+                line = bytes(buffer[:newline]).strip()
+                del buffer[:newline + 1]
+                if line:
+                    # Each request runs as its own task; its handler runs in a worker thread,
+                    # so a slow tool doesn't block reads or other requests
+                    task = asyncio.create_task(self.process_message(line))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+
+            if len(buffer) > MAX_MESSAGE_SIZE:
+                logger.error("Dropping oversized message (%d bytes without newline)", len(buffer))
+                buffer.clear()
+
+        # Handle a final message that arrived without a trailing newline
+        if buffer.strip():
+            await self.process_message(bytes(buffer).strip())
+        if pending:
+            await asyncio.gather(*pending)
+
+    async def process_message(self, line: bytes):
+        """Parse one JSON-RPC message, handle it and write the response"""
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received: %r", line[:200])
 
-                # Send response
-                response_str = json.dumps(response)
-                logger.info(f"Sending: {response_str[:200]}")
+            try:
+                request = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                logger.error(f"JSON decode error: {e}")
+                return
+
+            # Handle request
+            response = await self.handle_request(request)
+
+            # Send response - tools/list reuses the pre-serialized result
+            if request.get("method") == "tools/list":
+                response_bytes = b'{"jsonrpc":"2.0","id":%s,"result":%s}' % (
+                    orjson.dumps(response["id"]), TOOLS_LIST_JSON
+                )
+            else:
+                response_bytes = orjson.dumps(response, option=orjson.OPT_SERIALIZE_NUMPY)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending: %r", response_bytes[:200])
 
-                print(response_str, flush=True)
+            self.write_message(response_bytes)
 
-            except Exception as e:
-                logger.error(f"Error in main loop: {e}")
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {
-                        "code": -32603,
-                        "message": str(e)
-                    }
+        except Exception as e:
+            logger.error(f"Error in main loop: {e}")
+            error_response = {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {
+                    "code": -32603,
+                    "message": str(e)
                 }
-                print(json.dumps(error_response), flush=True)
+            }
+            self.write_message(orjson.dumps(error_response))
+
+    def write_message(self, payload: bytes):
+        """Write one newline-delimited JSON-RPC message to stdout"""
+        sys.stdout.buffer.write(payload + b"\n")
+        sys.stdout.buffer.flush()
 
 async def main():
     server = MCPServer()
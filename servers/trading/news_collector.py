@@ -7,6 +7,8 @@ Fetches and processes news from Alpaca News API with sentiment analysis
 import os
 import json
 import logging
+import threading
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
@@ -78,6 +80,11 @@ class NewsCollector:
 
         # Initialize sentiment analyzer (lazy loaded)
         self._sentiment_pipeline = None
+        # get_signals calls arrive from several threads (watchlist, REST workers):
+        # load the model once, and run one inference at a time - transformers
+        # pipelines and fast tokenizers are not safe to call concurrently
+        self._pipeline_load_lock = threading.Lock()
+        self._inference_lock = threading.Lock()
 
         # Cache for news items
         self.news_cache: Dict[str, List[NewsItem]] = {}
@@ -88,21 +95,23 @@ class NewsCollector:
     def sentiment_pipeline(self):
         """Lazy load sentiment analysis pipeline"""
         if self._sentiment_pipeline is None:
-            try:
-                # Use a financial-specific model if available
-                self._sentiment_pipeline = pipeline(
-                    "sentiment-analysis",
-                    model="ProsusAI/finbert",
-                    device=-1  # CPU
-                )
-                logger.info("Loaded FinBERT sentiment model")
-            except:
-                # Fallback to general sentiment model
-                self._sentiment_pipeline = pipeline(
-                    "sentiment-analysis",
-                    device=-1  # CPU
-                )
-                logger.info("Loaded default sentiment model")
+            with self._pipeline_load_lock:
+                if self._sentiment_pipeline is None:
+                    try:
+                        # Use a financial-specific model if available
+                        self._sentiment_pipeline = pipeline(
+                            "sentiment-analysis",
+                            model="ProsusAI/finbert",
+                            device=-1  # CPU
+                        )
+                        logger.info("Loaded FinBERT sentiment model")
+                    except:
+                        # Fallback to general sentiment model
+                        self._sentiment_pipeline = pipeline(
+                            "sentiment-analysis",
+                            device=-1  # CPU
+                        )
+                        logger.info("Loaded default sentiment model")
         return self._sentiment_pipeline
 
     def get_historical_news(
@@ -234,7 +243,9 @@ class NewsCollector:
             text = text[:512]
 
             # Get sentiment
-            results = self.sentiment_pipeline(text)
+            sentiment_pipeline = self.sentiment_pipeline
+            with self._inference_lock:
+                results = sentiment_pipeline(text)
             result = results[0]
 
             # Map FinBERT labels if using that model
@@ -331,9 +342,8 @@ class NewsCollector:
         sentiment_scores = [item.sentiment_score for item in items]
         relevance_scores = [item.relevance_score for item in items]
 
-        positive_count = sum(1 for item in items if item.sentiment_label == 'POSITIVE')
-        negative_count = sum(1 for item in items if item.sentiment_label == 'NEGATIVE')
-        neutral_count = sum(1 for item in items if item.sentiment_label == 'NEUTRAL')
+        # One C-level pass over the labels instead of a generator per label
+        label_counts = Counter(item.sentiment_label for item in items)
 
         # Weight by relevance
         weighted_sentiment = sum(
@@ -357,9 +367,9 @@ class NewsCollector:
             'sentiment_score': weighted_sentiment,
             'sentiment_label': label,
             'news_count': len(items),
-            'positive_count': positive_count,
-            'negative_count': negative_count,
-            'neutral_count': neutral_count,
+            'positive_count': label_counts['POSITIVE'],
+            'negative_count': label_counts['NEGATIVE'],
+            'neutral_count': label_counts['NEUTRAL'],
             'avg_relevance': np.mean(relevance_scores),
             'trending': trending,
             'latest_headlines': [item.headline for item in items[:3]]
@@ -381,7 +391,7 @@ class NewsCollector:
             item['updated_at'] = item['updated_at'].isoformat()
 
         with open(cache_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            json.dump(data, f, separators=(',', ':'))
 
         logger.info(f"Saved {len(news_items)} news items to cache for {symbol}")
 